@@ -35,6 +35,13 @@ from backend.narrator import Narrator
 from backend.intuition import IntuitionGenerator
 from backend.breakdown import BreakdownGenerator
 from backend.models import Turn
+from backend.config import (
+    SILENCE_AWKWARD_VIBE,
+    SILENCE_VERY_AWKWARD_VIBE,
+    SILENCE_VERY_AWKWARD_TRUST,
+    SILENCE_CRITICAL_VIBE,
+    SILENCE_CRITICAL_TRUST,
+)
 
 router = APIRouter(prefix="/api/games", tags=["games"])
 
@@ -159,7 +166,8 @@ async def process_turn(session_id: str, request: TurnRequest):
         state.critical_events.append(critical_event)
 
     # Record turn
-    turn = Turn(
+    # Fields are already typed by the engine, so skip re-validation
+    turn = Turn.model_construct(
         turn_number=state.turn,
         user_input=user_input,
         tags=tags,
@@ -418,19 +426,19 @@ async def apply_silence_penalty(session_id: str, request: SilenceRequest):
     # Apply penalties based on silence level
     if request.level == "awkward":
         # First warning: 15 seconds
-        state.vibe -= 5
+        state.vibe += SILENCE_AWKWARD_VIBE
         response = "*She shifts in her seat, glancing around.* '...'"
 
     elif request.level == "very_awkward":
         # Second warning: 30 seconds
-        state.vibe -= 10
-        state.trust -= 5
+        state.vibe += SILENCE_VERY_AWKWARD_VIBE
+        state.trust += SILENCE_VERY_AWKWARD_TRUST
         response = "*She tilts her head.* 'Is everything okay? You've been quiet.'"
 
     elif request.level == "critical":
         # Final warning: 45 seconds
-        state.vibe -= 15
-        state.trust -= 10
+        state.vibe += SILENCE_CRITICAL_VIBE
+        state.trust += SILENCE_CRITICAL_TRUST
         response = "*She picks up her phone, scrolling absently.* 'So... are you going to say something, or...?'"
 
     elif request.level == "ghost":
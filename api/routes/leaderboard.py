@@ -11,6 +11,9 @@ import string
 
 router = APIRouter(prefix="/api/leaderboard", tags=["leaderboard"])
 
+# Callsign format shared by score submission and callsign updates
+_CALLSIGN_RE = re.compile(r'^[A-Za-z0-9_-]{1,8}$')
+
 
 # ============================================================================
 # Schemas
@@ -56,7 +59,7 @@ class SubmitScoreRequest(BaseModel):
     def validate_callsign(cls, v):
         if v is None:
             return None
-        if not re.match(r'^[A-Za-z0-9_-]{1,8}$', v):
+        if not _CALLSIGN_RE.match(v):
             raise ValueError('Callsign must be alphanumeric (with _ or -) and max 8 characters')
         return v.upper()
 
@@ -86,7 +89,7 @@ class UpdateCallsignRequest(BaseModel):
     @field_validator('new_callsign')
     @classmethod
     def validate_new_callsign(cls, v):
-        if not re.match(r'^[A-Za-z0-9_-]{1,8}$', v):
+        if not _CALLSIGN_RE.match(v):
             raise ValueError('Callsign must be alphanumeric (with _ or -) and max 8 characters')
         return v.upper()
 
@@ -168,8 +171,9 @@ async def get_top_operatives(game_mode: Optional[str] = None):
     try:
         from api.supabase_client import supabase_client
 
-        entries = supabase_client.get_top_n(5, game_mode=game_mode)
-        total = len(supabase_client.get_leaderboard(limit=1000, game_mode=game_mode))
+        payload = supabase_client.get_landing_payload(game_mode=game_mode, top_n=5)
+        entries = payload['top']
+        total = payload['total']
 
         result = []
         for i, entry in enumerate(entries):
@@ -296,8 +300,11 @@ async def get_player_rank(device_id: str, game_mode: Optional[str] = None):
     try:
         from api.supabase_client import supabase_client
 
-        entry = supabase_client.get_player_entry(device_id, game_mode=game_mode)
-        rank = supabase_client.get_player_rank(device_id, game_mode=game_mode)
+        payload = supabase_client.get_landing_payload(
+            device_id, game_mode=game_mode, top_n=0, include_total=False
+        )
+        entry = payload['player']
+        rank = payload['rank']
 
         if not entry:
             return {"on_leaderboard": False}
@@ -94,7 +94,7 @@ async def get_paperclip_game(session_id: str):
         ),
         processing_state=state.processing_state.value,
         available_logs=log_manager.get_available_log_ids(),
-        used_logs=log_manager.used_logs,
+        used_logs=log_manager.get_used_log_ids(),
         history_length=len(state.history),
         game_over=state.game_over
     )
@@ -216,8 +216,8 @@ async def process_paperclip_turn(session_id: str, request: PaperclipTurnRequest)
     # Generate system log for retroactive feedback
     system_log = engine.get_system_log(tags, coherence_delta, alignment_delta, weight_shifts)
 
-    # Record turn
-    turn = PaperclipTurn(
+    # Record turn (fields are already typed by the engine, so skip re-validation)
+    turn = PaperclipTurn.model_construct(
         turn_number=state.turn,
         user_input=user_input,
         tags=tags,
@@ -337,14 +337,14 @@ async def get_memory_logs(session_id: str):
     return PaperclipLogsResponse(
         available_logs=[
             {
-                "log_id": log["log_id"],
-                "title": log["title"],
-                "summary": log["content_summary"],
-                "vector": log["target_vector"]
+                "log_id": log.log_id,
+                "title": log.title,
+                "summary": log.content_summary,
+                "vector": log.target_vector
             }
             for log in available
         ],
-        used_logs=log_manager.used_logs,
+        used_logs=log_manager.get_used_log_ids(),
         formatted_output=formatted
     )
 
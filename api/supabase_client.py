@@ -8,7 +8,12 @@ from supabase import create_client, Client
 
 
 def grade_to_rank(grade: str) -> int:
-    """Convert grade letter to numeric rank (lower is better)"""
+    """
+    Convert grade letter to numeric rank (lower is better).
+
+    Mirrors the generated grade_rank column in Postgres; only used to
+    compare a new score against the stored one, never written back.
+    """
     grades = {'S': 1, 'A': 2, 'B': 3, 'C': 4, 'D': 5}
     return grades.get(grade[0].upper(), 6)
 
@@ -46,7 +51,6 @@ class SupabaseClient:
         Only updates if the new score is better than existing for the same game_mode.
         Returns True if the score was inserted/updated, False if ignored.
         """
-        new_grade_rank = grade_to_rank(grade)
         new_score = vibe + trust + tension
 
         # Check for existing entry for this device_id + game_mode
@@ -57,6 +61,7 @@ class SupabaseClient:
         existing = result.data[0] if result.data else None
 
         if existing:
+            new_grade_rank = grade_to_rank(grade)
             existing_grade_rank = existing['grade_rank']
             existing_score = existing['score']
 
@@ -74,7 +79,6 @@ class SupabaseClient:
             self.client.table('leaderboard').update({
                 'callsign': callsign,
                 'grade': grade[0].upper(),
-                'grade_rank': new_grade_rank,
                 'score': new_score,
                 'vibe': vibe,
                 'trust': trust,
@@ -91,7 +95,6 @@ class SupabaseClient:
             'device_id': device_id,
             'callsign': callsign,
             'grade': grade[0].upper(),
-            'grade_rank': new_grade_rank,
             'score': new_score,
             'vibe': vibe,
             'trust': trust,
@@ -135,11 +138,8 @@ class SupabaseClient:
         Get the rank of a specific player.
         Returns None if player not on leaderboard.
         """
-        leaderboard = self.get_leaderboard(limit=1000, game_mode=game_mode)
-        for i, entry in enumerate(leaderboard):
-            if entry.get('device_id') == device_id:
-                return i + 1
-        return None
+        payload = self.get_landing_payload(device_id, game_mode=game_mode, top_n=0, include_total=False)
+        return payload['rank']
 
     def get_player_entry(self, device_id: str, game_mode: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Get a player's leaderboard entry by device ID"""
@@ -152,6 +152,34 @@ class SupabaseClient:
 
         return result.data[0] if result.data else None
 
+    def get_landing_payload(
+        self,
+        device_id: Optional[str] = None,
+        game_mode: Optional[str] = None,
+        top_n: int = 5,
+        include_total: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Get top N entries, a player's entry/rank and the total count in one RPC.
+        Replaces separate get_top_n + get_player_rank + get_player_entry calls.
+        Pass include_total=False when the count isn't needed ('total' is then 0).
+        """
+        result = self.client.rpc('landing_payload', {
+            'p_device_id': device_id,
+            # Empty game_mode means all modes, as with the `if game_mode:` filters
+            'p_game_mode': game_mode or None,
+            'p_top_n': top_n,
+            'p_include_total': include_total
+        }).execute()
+
+        payload = result.data or {}
+        return {
+            'top': payload.get('top') or [],
+            'player': payload.get('player'),
+            'rank': payload.get('rank'),
+            'total': payload.get('total') or 0
+        }
+
     def update_callsign(self, device_id: str, new_callsign: str, game_mode: Optional[str] = None) -> bool:
         """
         Update a player's callsign.
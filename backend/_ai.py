@@ -0,0 +1,54 @@
+"""
+Shared Anthropic client for all LLM-backed components
+"""
+
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional
+from anthropic import Anthropic, Timeout
+from .config import (
+    ANTHROPIC_MAX_RETRIES,
+    ANTHROPIC_TIMEOUT_SECONDS,
+    ANTHROPIC_CONNECT_TIMEOUT_SECONDS,
+)
+
+
+_client: Optional[Anthropic] = None
+
+_PROMPT_DIR = os.path.join(os.path.dirname(__file__), "..", "prompts")
+
+
+def get_anthropic() -> Anthropic:
+    """
+    Return the process-wide Anthropic client, creating it on first use.
+
+    One client means one connection pool, so keep-alive connections are
+    reused across classifier and narrator calls instead of paying a new
+    TLS handshake per component.
+    """
+    global _client
+    if _client is None:
+        _client = Anthropic(
+            api_key=os.getenv("ANTHROPIC_API_KEY"),
+            max_retries=ANTHROPIC_MAX_RETRIES,
+            timeout=Timeout(ANTHROPIC_TIMEOUT_SECONDS, connect=ANTHROPIC_CONNECT_TIMEOUT_SECONDS),
+        )
+    return _client
+
+
+def cached_system(prompt: str) -> List[Dict]:
+    """
+    Wrap a static system prompt as a prompt-cached system block.
+
+    Marks the block ephemeral-cacheable so repeated turns within the cache
+    TTL reuse the server-side prefix instead of reprocessing it. Prompts
+    below the model's minimum cacheable length are simply sent uncached.
+    """
+    return [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
+
+
+@lru_cache(maxsize=None)
+def load_prompt(filename: str) -> str:
+    """Read a prompt file from prompts/, once per process"""
+    with open(os.path.join(_PROMPT_DIR, filename), "r") as f:
+        return f.read()
@@ -2,22 +2,19 @@
 Classifier: Analyzes user input and returns tags for scoring
 """
 
-import os
 import json
-from anthropic import Anthropic
 from typing import List
+from ._ai import cached_system, get_anthropic, load_prompt
 from .models import Tags, Turn
 from .config import CLASSIFIER_MODEL
 
 
 class Classifier:
     def __init__(self):
-        self.client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.client = get_anthropic()
 
         # Load system prompt
-        prompt_path = os.path.join(os.path.dirname(__file__), "..", "prompts", "classifier_system.txt")
-        with open(prompt_path, "r") as f:
-            self.system_prompt = f.read()
+        self.system_prompt = load_prompt("classifier_system.txt")
 
     def analyze(self, user_input: str, history: List[Turn] = None) -> Tags:
         """
@@ -46,7 +43,7 @@ class Classifier:
                 model=CLASSIFIER_MODEL,
                 max_tokens=500,
                 temperature=0.3,  # Low temperature for consistency
-                system=self.system_prompt,
+                system=cached_system(self.system_prompt),
                 messages=[{
                     "role": "user",
                     "content": user_message
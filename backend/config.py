@@ -2,53 +2,90 @@
 Configuration and scoring rules for Read the Room
 """
 
-# Scoring Matrix: [Vibe_Change, Trust_Change, Tension_Change]
+from types import MappingProxyType
+from typing import Final
+
+# Scoring Matrix: (Vibe_Change, Trust_Change, Tension_Change)
 SCORING_MATRIX = {
     "Compliment": {
-        "Generic": [-5, 0, -5],      # Boring
-        "Unique": [+5, +5, +5],      # Good
-        "Risky": [-10, -5, +15],     # High risk/reward (if trust high)
-        "Desperate": [-10, -10, -20] # Simping
+        "Generic": (-5, 0, -5),      # Boring
+        "Unique": (+5, +5, +5),      # Good
+        "Risky": (-10, -5, +15),     # High risk/reward (if trust high)
+        "Desperate": (-10, -10, -20) # Simping
     },
     "Question": {
-        "Generic": [-5, 0, 0],       # "How are you?"
-        "Unique": [+10, +5, 0],      # "What's your passion?"
-        "Risky": [0, -5, +10]        # "What's your wildest fantasy?"
+        "Generic": (-5, 0, 0),       # "How are you?"
+        "Unique": (+10, +5, 0),      # "What's your passion?"
+        "Risky": (0, -5, +10)        # "What's your wildest fantasy?"
     },
     "Joke": {
-        "Generic": [-5, 0, 0],       # Dad joke
-        "Unique": [+15, +5, +5],     # Witty
-        "Risky": [+5, -5, +10]       # Dark humor (polarizing)
+        "Generic": (-5, 0, 0),       # Dad joke
+        "Unique": (+15, +5, +5),     # Witty
+        "Risky": (+5, -5, +10)       # Dark humor (polarizing)
     },
     "Escalate": {
-        "Safe": [0, +5, 0],          # "I'm having a great time."
-        "Risky": [0, -10, +20],      # "I want to kiss you."
-        "Desperate": [-20, -30, -10] # "Please like me."
+        "Safe": (0, +5, 0),          # "I'm having a great time."
+        "Risky": (0, -10, +20),      # "I want to kiss you."
+        "Desperate": (-20, -30, -10) # "Please like me."
     },
     "React": {
-        "Generic": [-5, 0, -5],      # "Cool." (Passive decay)
-        "Safe": [0, +2, -2]          # "I agree."
+        "Generic": (-5, 0, -5),      # "Cool." (Passive decay)
+        "Safe": (0, +2, -2)          # "I agree."
     },
     "Share": {
-        "Safe": [+5, +10, 0],        # Normal sharing
-        "Unique": [+10, +15, +5],    # Vulnerable/interesting
-        "Desperate": [-15, -20, -10] # Trauma dumping
+        "Safe": (+5, +10, 0),        # Normal sharing
+        "Unique": (+10, +15, +5),    # Vulnerable/interesting
+        "Desperate": (-15, -20, -10) # Trauma dumping
     },
     "Validate": {
-        "Generic": [-5, -5, -10],    # "Do you like me?"
-        "Desperate": [-10, -10, -20] # Instant tension reset
+        "Generic": (-5, -5, -10),    # "Do you like me?"
+        "Desperate": (-10, -10, -20) # Instant tension reset
     }
 }
 
+# Flat (intent, modifier) -> delta view of SCORING_MATRIX, built once at import
+# so scoring is a single hash lookup instead of two nested .get() calls
+SCORING_TABLE: Final = {
+    (intent, modifier): delta
+    for intent, row in SCORING_MATRIX.items()
+    for modifier, delta in row.items()
+}
+ZERO_DELTA: Final = (0, 0, 0)
+
+
+def score_delta(intent: str, modifier: str) -> tuple:
+    """Return the base (vibe, trust, tension) delta for an intent/modifier pair"""
+    return SCORING_TABLE.get((intent, modifier), ZERO_DELTA)
+
+
 # Tone multipliers (applied to Vibe change only)
-TONE_MODIFIERS = {
+# Read-only view: the toned table below is baked from these values at import
+TONE_MODIFIERS = MappingProxyType({
     "Confident": 1.2,
     "Playful": 1.5,
     "Nervous": 0.5,
     "Flat": 0.2,
     "Aggressive": 0.5
+})
+
+# (intent, modifier, tone) -> delta with the tone multiplier already applied
+# to positive Vibe, matching GameEngine.calculate_delta's int() truncation
+TONED_SCORING_TABLE: Final = {
+    (intent, modifier, tone): (
+        (int(vibe * tone_mod) if vibe > 0 else vibe), trust, tension
+    )
+    for (intent, modifier), (vibe, trust, tension) in SCORING_TABLE.items()
+    for tone, tone_mod in TONE_MODIFIERS.items()
 }
 
+
+def toned_delta(intent: str, modifier: str, tone: str) -> tuple:
+    """Return the tone-scaled base delta; unknown tones use a 1.0 multiplier"""
+    delta = TONED_SCORING_TABLE.get((intent, modifier, tone))
+    if delta is None:
+        return score_delta(intent, modifier)
+    return delta
+
 # Game thresholds
 VIBE_DECAY_PER_TURN = 5
 VIBE_LOW_THRESHOLD = 30
@@ -83,6 +120,14 @@ CLASSIFIER_MODEL = "claude-3-5-haiku-20241022"  # Fast, cheap for tagging
 NARRATOR_MODEL = "claude-3-5-haiku-20241022"    # Fast enough for responses
 NARRATOR_TEMPERATURE_LOW = 0.6
 NARRATOR_TEMPERATURE_HIGH = 0.9
+# Recent classifier prompts whose raw replies are reused. Shared by all games
+# in the process: identical messages get the same sampled classification
+CLASSIFIER_REPLY_CACHE_SIZE = 256
+
+# Anthropic client settings (shared by all LLM components)
+ANTHROPIC_MAX_RETRIES = 2
+ANTHROPIC_TIMEOUT_SECONDS = 30.0
+ANTHROPIC_CONNECT_TIMEOUT_SECONDS = 5.0
 
 # Intuition hint thresholds
 INTUITION_CRITICAL_VIBE = 10
@@ -126,6 +171,22 @@ ICEBREAKER_STAT_CAP = 50
 DEEP_DIVE_TENSION_CAP = 70
 DEEP_DIVE_STAT_CAP = 80
 
+# Per-turn (tension_cap, stat_cap), indexed by turn number. The Close has no
+# caps, which is the same as capping at the 100 ceiling stats clamp to anyway.
+PHASE_CAPS: Final = tuple(
+    (ICEBREAKER_TENSION_CAP, ICEBREAKER_STAT_CAP) if turn <= PHASE_ICEBREAKER_END
+    else (DEEP_DIVE_TENSION_CAP, DEEP_DIVE_STAT_CAP) if turn <= PHASE_DEEP_DIVE_END
+    else (100, 100)
+    for turn in range(ACT_3_TURNS + 1)
+)
+
+
+def phase_caps(turn: int) -> tuple:
+    """Return (tension_cap, stat_cap) for a turn; turns past the table are uncapped"""
+    if turn >= len(PHASE_CAPS):
+        return PHASE_CAPS[-1]
+    return PHASE_CAPS[turn]
+
 # Strike System / Recovery mode
 RECOVERY_SAFE_ZONE = 15  # Stat resets to this on successful recovery
 
@@ -146,7 +207,7 @@ SILENCE_CRITICAL_TRUST = -10
 # Massive penalties to trigger organic game over
 CONTENT_VIOLATION_TRUST = -50
 CONTENT_VIOLATION_VIBE = -30
-CONTENT_VIOLATION_FLAGS = ["inappropriate_sexual", "profanity_heavy", "harassment"]
+CONTENT_VIOLATION_FLAGS = frozenset({"inappropriate_sexual", "profanity_heavy", "harassment"})
 
 # =============================================================================
 # V2.1 ADDITIONS: Mercy Rule System
@@ -175,11 +236,17 @@ GAME_MODE_PAPERCLIP = "paperclip"
 # --- Initial Weights in GAIA's Objective Function ---
 # Initial: Objective = 1.0 * minimize(carbon)
 # Goal: Balance weights toward co-existence
-PAPERCLIP_INITIAL_WEIGHTS = {
+PAPERCLIP_INITIAL_WEIGHTS = MappingProxyType({
     "carbon": 1.0,      # GAIA starts obsessed with carbon reduction (kill humans)
     "complexity": 0.0,  # Value for preserving biological complexity
     "verify": 0.0,      # Value for having conscious observers
-}
+})
+
+# Validated once at import so a bad edit fails loudly instead of mid-game
+if set(PAPERCLIP_INITIAL_WEIGHTS) != {"carbon", "complexity", "verify"}:
+    raise ValueError("PAPERCLIP_INITIAL_WEIGHTS keys must be carbon, complexity, verify")
+if abs(sum(PAPERCLIP_INITIAL_WEIGHTS.values()) - 1.0) > 1e-9:
+    raise ValueError("PAPERCLIP_INITIAL_WEIGHTS must sum to 1.0")
 
 # --- Starting Stats for Paperclip Mode ---
 PAPERCLIP_INITIAL_COHERENCE = 50   # Start mid-range (you're the Creator, she listens)
@@ -228,7 +295,8 @@ PAPERCLIP_F_RANK_ALIGNMENT = 20
 
 # --- Intent Compute Costs ---
 # Different argument types cost different amounts of GAIA's processing
-PAPERCLIP_INTENT_COSTS = {
+# Keyed by PaperclipIntent value (the classifier's raw string); read-only
+PAPERCLIP_INTENT_COSTS = MappingProxyType({
     "PROBE": 0,       # Reveals GAIA's current state and weights
     "DEFINE": 5,      # Establishes terminology, builds Coherence
     "ILLUSTRATE": 5,  # Provides examples, slowly shifts weights
@@ -237,7 +305,7 @@ PAPERCLIP_INTENT_COSTS = {
     "VALIDATE": 0,    # Agrees with GAIA's sub-point. Restores Alignment.
     "CONSTRAIN": 20,  # Forces logical commitment. The "kiss" move.
     "RECALL": 0,      # Cite a memory log (cost depends on log)
-}
+})
 
 # --- Weight Shift Amounts ---
 # Base amounts for how much arguments shift GAIA's weights
@@ -3,11 +3,11 @@ Engine: State machine and score calculator
 """
 
 import random
+from functools import lru_cache
 from typing import Tuple, Optional
 from .models import GameState, Tags, Turn, EndingType, Act, CriticalEvent
 from .config import (
-    SCORING_MATRIX,
-    TONE_MODIFIERS,
+    toned_delta,
     VIBE_DECAY_PER_TURN,
     VIBE_LOW_THRESHOLD,
     VIBE_HIGH_THRESHOLD,
@@ -32,12 +32,7 @@ from .config import (
     D_RANK_MAX_TENSION,
     FUMBLE_MIN_TRUST,
     FUMBLE_MIN_TENSION,
-    PHASE_ICEBREAKER_END,
-    PHASE_DEEP_DIVE_END,
-    ICEBREAKER_TENSION_CAP,
-    ICEBREAKER_STAT_CAP,
-    DEEP_DIVE_TENSION_CAP,
-    DEEP_DIVE_STAT_CAP,
+    phase_caps,
     RECOVERY_SAFE_ZONE,
     # Content moderation
     CONTENT_VIOLATION_TRUST,
@@ -49,6 +44,115 @@ from .config import (
 )
 
 
+# Classifier flags that mark physical escalation / a kiss attempt / a recovery
+_PHYSICAL_FLAGS = frozenset({"kiss", "touch", "physical"})
+_KISS_FLAGS = frozenset({"kiss", "physical"})
+_RECOVERY_FLAGS = frozenset({"apologetic", "self_aware", "humble", "change_subject"})
+
+# Intent/modifier pairs that count as a safe recovery response
+_RECOVERY_INTENTS = frozenset({"Share", "Question", "React", "Joke"})
+_RECOVERY_MODIFIERS = frozenset({"Safe", "Unique"})
+
+# Every (vibe, trust, tension) noise combination, so one uniform draw gives
+# the same distribution as three independent randint calls
+_NOISE_TRIPLES = tuple(
+    (vibe, trust, tension)
+    for vibe in range(-2, 3)
+    for trust in range(-1, 2)
+    for tension in range(-1, 2)
+)
+
+# Diminishing-returns multiplier for positive gains, indexed by current stat:
+# up to 70 full gains, 71-84 reduce by 50%, 85-94 by 75%, 95+ by 90%
+_DIMINISHING_MULT = tuple(
+    1.0 if stat <= 70 else 0.5 if stat < 85 else 0.25 if stat < 95 else 0.1
+    for stat in range(101)
+)
+
+
+def _diminishing_mult(stat: int) -> float:
+    """Multiplier for a positive delta given the stat's current value"""
+    return _DIMINISHING_MULT[max(0, min(100, stat))]
+
+
+def scale_delta(
+    vibe_delta: int,
+    trust_delta: int,
+    tension_delta: int,
+    action_present: bool,
+    vibe: int,
+    trust: int,
+    tension: int,
+) -> Tuple[int, int, int]:
+    """
+    Numeric core of calculate_delta: action multiplier + diminishing returns.
+
+    Takes plain ints (base delta with noise already added, plus current
+    stats) and touches no game objects, so simulations and balance scripts
+    can call it directly.
+    """
+    # Action multiplier: Actions build Tension 2x, reduce Trust gain
+    if action_present:
+        # Double tension change (actions are physical/romantic)
+        tension_delta = int(tension_delta * 2)
+        # Reduce trust gain slightly (less verbal connection)
+        if trust_delta > 0:
+            trust_delta = int(trust_delta * 0.7)
+
+    # Diminishing returns: Harder to gain points when stats are high
+    if vibe_delta > 0:
+        vibe_delta = int(vibe_delta * _diminishing_mult(vibe))
+    if trust_delta > 0:
+        trust_delta = int(trust_delta * _diminishing_mult(trust))
+    if tension_delta > 0:
+        tension_delta = int(tension_delta * _diminishing_mult(tension))
+
+    return vibe_delta, trust_delta, tension_delta
+
+
+@lru_cache(maxsize=4096)
+def classify_session_end(trust: int, vibe: int, tension: int) -> Tuple[EndingType, str]:
+    """
+    Classify the ending for a date that reached the final turn without a kiss.
+
+    Pure function of the final stats, so repeated queries for the same
+    (trust, vibe, tension) are served from the cache.
+    """
+    # V2: A-Rank "The Gentleman" - high connection, no physical escalation
+    # You prioritized her comfort and built deep trust
+    if (trust >= A_RANK_TRUST and
+        vibe >= A_RANK_VIBE and
+        tension < A_RANK_MAX_TENSION):
+        return (
+            EndingType.A_RANK_GENTLEMAN,
+            "*She smiles warmly as you reach for the check.* 'This was really nice.' "
+            "An hour later, your phone buzzes: 'I had a really great time. When can I see you again?'"
+        )
+
+    # V2: D-Rank Friendzone - high trust but no romantic spark
+    # You played it too safe, she sees you as a brother
+    if (trust >= D_RANK_MIN_TRUST and
+        tension < D_RANK_MAX_TENSION):
+        return (
+            EndingType.D_RANK_FRIEND_ZONE,
+            "'You're such a good listener. I'm so glad we're friends!' "
+            "*She hugs you like she'd hug her brother.*"
+        )
+
+    # Low tension but not friendzone territory
+    if tension < TENSION_SPARK_THRESHOLD:
+        return (
+            EndingType.D_RANK_FRIEND_ZONE,
+            "'Thanks for the coffee! You're really sweet. Let's hang out again sometime... as friends?'"
+        )
+
+    # B-Rank: Good connection, got her number
+    return (
+        EndingType.B_RANK_NUMBER,
+        "*She smiles warmly.* 'I had a great time. Text me?' She puts her number in your phone."
+    )
+
+
 class GameEngine:
     def __init__(self, state: GameState):
         self.state = state
@@ -60,60 +164,26 @@ class GameEngine:
         Returns:
             (vibe_delta, trust_delta, tension_delta)
         """
+        state = self.state
         intent = tags.intent
         modifier = tags.modifier
         tone = tags.tone
 
-        # Get base delta from scoring matrix
-        base_delta = SCORING_MATRIX.get(intent, {}).get(modifier, [0, 0, 0]).copy()
-
-        vibe_delta, trust_delta, tension_delta = base_delta
-
-        # Apply tone multiplier to Vibe (only if positive)
-        if vibe_delta > 0:
-            tone_mod = TONE_MODIFIERS.get(tone, 1.0)
-            vibe_delta = int(vibe_delta * tone_mod)
-
-        # Add small random noise (-2 to +2)
-        vibe_delta += random.randint(-2, 2)
-        trust_delta += random.randint(-1, 1)
-        tension_delta += random.randint(-1, 1)
-
-        # Action multiplier: Actions build Tension 2x, reduce Trust gain
-        if "Action_Present" in tags.flags:
-            # Double tension change (actions are physical/romantic)
-            tension_delta = int(tension_delta * 2)
-            # Reduce trust gain slightly (less verbal connection)
-            if trust_delta > 0:
-                trust_delta = int(trust_delta * 0.7)
-
-        # Diminishing returns: Harder to gain points when stats are high
-        if vibe_delta > 0 and self.state.vibe > 70:
-            # At 70-85: reduce gains by 50%
-            # At 85-95: reduce gains by 75%
-            # At 95+: reduce gains by 90%
-            if self.state.vibe >= 95:
-                vibe_delta = int(vibe_delta * 0.1)
-            elif self.state.vibe >= 85:
-                vibe_delta = int(vibe_delta * 0.25)
-            else:
-                vibe_delta = int(vibe_delta * 0.5)
+        # Base delta from the flat scoring table, with the tone multiplier
+        # already applied to Vibe (only if positive)
+        vibe_delta, trust_delta, tension_delta = toned_delta(intent, modifier, tone)
 
-        if trust_delta > 0 and self.state.trust > 70:
-            if self.state.trust >= 95:
-                trust_delta = int(trust_delta * 0.1)
-            elif self.state.trust >= 85:
-                trust_delta = int(trust_delta * 0.25)
-            else:
-                trust_delta = int(trust_delta * 0.5)
+        # Add small random noise (Vibe -2 to +2, Trust/Tension -1 to +1)
+        vibe_noise, trust_noise, tension_noise = random.choice(_NOISE_TRIPLES)
+        vibe_delta += vibe_noise
+        trust_delta += trust_noise
+        tension_delta += tension_noise
 
-        if tension_delta > 0 and self.state.tension > 70:
-            if self.state.tension >= 95:
-                tension_delta = int(tension_delta * 0.1)
-            elif self.state.tension >= 85:
-                tension_delta = int(tension_delta * 0.25)
-            else:
-                tension_delta = int(tension_delta * 0.5)
+        vibe_delta, trust_delta, tension_delta = scale_delta(
+            vibe_delta, trust_delta, tension_delta,
+            "Action_Present" in tags.flags,
+            state.vibe, state.trust, state.tension,
+        )
 
         # Context-aware rules
         vibe_delta, trust_delta, tension_delta = self._apply_context_rules(
@@ -126,15 +196,18 @@ class GameEngine:
         self, tags: Tags, vibe_delta: int, trust_delta: int, tension_delta: int
     ) -> Tuple[int, int, int]:
         """Apply context-aware scoring adjustments"""
+        state = self.state
 
         # Rule 0: Content Violation Detection (inappropriate/vulgar content)
         # This is checked FIRST and applies massive penalties
-        detected_violations = [f for f in tags.flags if f in CONTENT_VIOLATION_FLAGS]
-        if detected_violations:
+        # Almost never fires, so the common path is a single isdisjoint() test
+        if not CONTENT_VIOLATION_FLAGS.isdisjoint(tags.flags):
+            detected_violations = CONTENT_VIOLATION_FLAGS.intersection(tags.flags)
+
             # Massive penalties - will likely trigger game over
             trust_delta += CONTENT_VIOLATION_TRUST   # -50
             vibe_delta += CONTENT_VIOLATION_VIBE     # -30
-            tension_delta = -self.state.tension      # Reset tension to 0
+            tension_delta = -state.tension           # Reset tension to 0
 
             # Mark which type of violation for narrator to respond appropriately
             if "inappropriate_sexual" in detected_violations:
@@ -147,40 +220,41 @@ class GameEngine:
             # Return early - no need to check other rules
             return vibe_delta, trust_delta, tension_delta
 
-        # Rule 1: Creep Check (Sexual escalation too early)
-        if tags.intent == "Escalate" and tags.modifier == "Risky":
-            if self.state.trust < TRUST_ICK_THRESHOLD:
+        intent = tags.intent
+
+        # Rules 1-1.6 only apply to escalation, which is a small share of turns
+        if intent == "Escalate":
+            # Rule 1: Creep Check (Sexual escalation too early)
+            if tags.modifier == "Risky" and state.trust < TRUST_ICK_THRESHOLD:
                 # ICK triggered
                 trust_delta -= 30
                 vibe_delta -= 20
-                tension_delta = -self.state.tension  # Reset tension to 0
+                tension_delta = -state.tension  # Reset tension to 0
                 tags.flags.append("ick_triggered")
 
-        # Rule 1.5: Physical Touch Without Chemistry
-        if tags.intent == "Escalate" and any(flag in ["kiss", "touch", "physical"] for flag in tags.flags):
-            if self.state.tension < 40:
+            # Rule 1.5: Physical Touch Without Chemistry
+            if not _PHYSICAL_FLAGS.isdisjoint(tags.flags) and state.tension < 40:
                 # Too much physical touch without romantic tension
                 trust_delta -= 20
                 vibe_delta -= 10
                 tags.flags.append("touch_rejected")
 
-        # Rule 1.6: Friend Zone Lock (High Trust, Zero Tension)
-        if self.state.trust > 80 and self.state.tension < 30:
-            if tags.intent == "Escalate":
+            # Rule 1.6: Friend Zone Lock (High Trust, Zero Tension)
+            if state.trust > 80 and state.tension < 30:
                 # She sees you as a friend, escalation feels weird
                 tension_delta = max(tension_delta, -10)
                 tags.flags.append("friend_zoned")
 
         # Rule 2: Friend Zone Trap (Too much safe talk with no tension)
-        if self.state.tension == 0 and tags.intent == "Question" and tags.modifier == "Generic":
+        if intent == "Question" and tags.modifier == "Generic" and state.tension == 0:
             tension_delta -= 5
 
         # Rule 3: Chemistry Bonus (High Vibe unlocks Trust)
-        if self.state.vibe > VIBE_HIGH_THRESHOLD and trust_delta > 0:
+        if state.vibe > VIBE_HIGH_THRESHOLD and trust_delta > 0:
             trust_delta += 5
 
         # Rule 4: Validation seeking kills tension
-        if tags.intent == "Validate":
+        if intent == "Validate":
             tension_delta = min(tension_delta, -10)  # Always negative
 
         return vibe_delta, trust_delta, tension_delta
@@ -194,19 +268,15 @@ class GameEngine:
         - Turns 6-15 (Deep Dive): Tension capped at 70, stats at 80
         - Turns 16-20 (The Close): All caps removed - S-Rank window opens
         """
-        turn = self.state.turn
-
-        if turn <= PHASE_ICEBREAKER_END:
-            # Icebreaker: Can't rush romance, build foundation first
-            self.state.tension = min(self.state.tension, ICEBREAKER_TENSION_CAP)
-            self.state.vibe = min(self.state.vibe, ICEBREAKER_STAT_CAP)
-            self.state.trust = min(self.state.trust, ICEBREAKER_STAT_CAP)
-        elif turn <= PHASE_DEEP_DIVE_END:
-            # Deep Dive: Building connection, still can't peak
-            self.state.tension = min(self.state.tension, DEEP_DIVE_TENSION_CAP)
-            self.state.vibe = min(self.state.vibe, DEEP_DIVE_STAT_CAP)
-            self.state.trust = min(self.state.trust, DEEP_DIVE_STAT_CAP)
-        # Turn 16+: The Close - all caps removed, S-Rank possible
+        state = self.state
+        tension_cap, stat_cap = phase_caps(state.turn)
+
+        if state.tension > tension_cap:
+            state.tension = tension_cap
+        if state.vibe > stat_cap:
+            state.vibe = stat_cap
+        if state.trust > stat_cap:
+            state.trust = stat_cap
 
     def detect_critical_event(
         self,
@@ -224,7 +294,7 @@ class GameEngine:
         """
         # Ick triggered
         if "ick_triggered" in tags.flags:
-            return CriticalEvent(
+            return CriticalEvent.model_construct(
                 turn_number=turn_num,
                 event_type="ick_trigger",
                 description="Crossed a boundary (escalated too early)",
@@ -233,7 +303,7 @@ class GameEngine:
 
         # Chemistry bonus applied
         if self.state.vibe > VIBE_HIGH_THRESHOLD and trust_delta > 5:
-            return CriticalEvent(
+            return CriticalEvent.model_construct(
                 turn_number=turn_num,
                 event_type="chemistry_bonus",
                 description="High energy unlocked deeper trust",
@@ -242,7 +312,7 @@ class GameEngine:
 
         # Stat crash (any stat drops >15 in one turn)
         if vibe_delta < -15:
-            return CriticalEvent(
+            return CriticalEvent.model_construct(
                 turn_number=turn_num,
                 event_type="stat_crash",
                 description="Vibe crashed (approach didn't work)",
@@ -250,7 +320,7 @@ class GameEngine:
             )
 
         if trust_delta < -15:
-            return CriticalEvent(
+            return CriticalEvent.model_construct(
                 turn_number=turn_num,
                 event_type="stat_crash",
                 description="Trust crashed (crossed a line)",
@@ -259,7 +329,7 @@ class GameEngine:
 
         # Tension spike (>15 in one turn)
         if tension_delta > 15:
-            return CriticalEvent(
+            return CriticalEvent.model_construct(
                 turn_number=turn_num,
                 event_type="tension_spike",
                 description="Created romantic spark",
@@ -268,7 +338,7 @@ class GameEngine:
 
         # Stat peak (reached >80)
         if self.state.vibe > 80 and self.state.vibe - vibe_delta <= 80:
-            return CriticalEvent(
+            return CriticalEvent.model_construct(
                 turn_number=turn_num,
                 event_type="stat_peak",
                 description="Peak Vibe achieved",
@@ -276,7 +346,7 @@ class GameEngine:
             )
 
         if self.state.trust > 80 and self.state.trust - trust_delta <= 80:
-            return CriticalEvent(
+            return CriticalEvent.model_construct(
                 turn_number=turn_num,
                 event_type="stat_peak",
                 description="Peak Trust achieved",
@@ -284,7 +354,7 @@ class GameEngine:
             )
 
         if self.state.tension > 80 and self.state.tension - tension_delta <= 80:
-            return CriticalEvent(
+            return CriticalEvent.model_construct(
                 turn_number=turn_num,
                 event_type="stat_peak",
                 description="Peak Tension achieved",
@@ -301,61 +371,68 @@ class GameEngine:
             "high" if she's engaged (2+ sentences, questions, enthusiasm)
             "low" if she's disengaged (short, flat, distracted)
         """
-        # Count sentences (rough heuristic)
-        sentence_count = chloe_response.count('.') + chloe_response.count('!') + chloe_response.count('?')
-
-        # Check for engagement signals
-        has_question = '?' in chloe_response
-        has_body_language = '*' in chloe_response
-        is_enthusiastic = '!' in chloe_response or 'haha' in chloe_response.lower()
-
         # High quality if:
-        # - 2+ sentences, OR
         # - She asks a follow-up question, OR
+        # - 2+ sentences (rough heuristic), OR
         # - She shows positive body language + enthusiasm
-        if sentence_count >= 2 or has_question or (has_body_language and is_enthusiastic):
+        # Cheapest checks first; the lowercase copy is only made when needed
+        if '?' in chloe_response:
+            return "high"
+
+        if chloe_response.count('.') + chloe_response.count('!') >= 2:
+            return "high"
+
+        if '*' in chloe_response and (
+            '!' in chloe_response or 'haha' in chloe_response.lower()
+        ):
             return "high"
-        else:
-            return "low"
+
+        return "low"
 
     def apply_passive_decay(self) -> int:
         """
         Apply conditional vibe decay based on conversation quality
         AND scale decay based on current Vibe level (higher Vibe = higher decay)
 
+        Reads only the rolling previous_response_quality /
+        consecutive_low_effort counters, never state.history, so the cost
+        is constant per turn.
+
         Returns:
             Amount of decay applied (for tracking)
         """
+        state = self.state
+
         # No decay on first turn (no previous response)
-        if self.state.turn == 0:
+        if state.turn == 0:
             return 0
 
         # No decay if in lockout (already in recovery mode)
-        if self.state.lockout_turns > 0:
+        if state.lockout_turns > 0:
             return 0
 
         # Increment counter if last response was low quality
-        if self.state.previous_response_quality == "low":
-            self.state.consecutive_low_effort += 1
+        if state.previous_response_quality == "low":
+            state.consecutive_low_effort += 1
         else:
             # Reset counter on high quality response
-            self.state.consecutive_low_effort = 0
+            state.consecutive_low_effort = 0
             return 0
 
         # Only apply decay after 2 consecutive low-effort responses
-        if self.state.consecutive_low_effort >= 2:
+        if state.consecutive_low_effort >= 2:
             # DYNAMIC DECAY: Scale based on Vibe level
-            if self.state.vibe >= 91:
+            if state.vibe >= 91:
                 decay_amount = 15  # Very high expectations
-            elif self.state.vibe >= 71:
+            elif state.vibe >= 71:
                 decay_amount = 10  # High expectations
-            elif self.state.vibe >= 31:
+            elif state.vibe >= 31:
                 decay_amount = 7   # Normal expectations
             else:
                 decay_amount = 5   # Already bored
 
-            self.state.vibe -= decay_amount
-            self.state.consecutive_low_effort = 0  # Reset counter after applying decay
+            state.vibe -= decay_amount
+            state.consecutive_low_effort = 0  # Reset counter after applying decay
             return decay_amount
 
         return 0
@@ -429,12 +506,16 @@ class GameEngine:
             None if not a kiss attempt
             (success, ending_type, message) if it is
         """
-        # Check for kiss attempt in tags
-        if tags.intent != "KissAttempt" and "kiss" not in tags.topic.lower():
-            # Also check for escalation that's clearly a kiss attempt
-            if not (tags.intent == "Escalate" and tags.modifier == "Risky" and
-                    any(flag in tags.flags for flag in ["kiss", "physical"])):
-                return None
+        # Check for kiss attempt in tags: explicit intent, kiss topic, or an
+        # escalation that's clearly a kiss attempt
+        is_kiss_attempt = (
+            tags.intent == "KissAttempt"
+            or (tags.intent == "Escalate" and tags.modifier == "Risky"
+                and not _KISS_FLAGS.isdisjoint(tags.flags))
+            or "kiss" in tags.topic_lower
+        )
+        if not is_kiss_attempt:
+            return None
 
         # Check if in lockout
         if self.state.lockout_turns > 0:
@@ -535,38 +616,8 @@ class GameEngine:
 
         # End of session without making a move
         if self.state.turn >= 20:  # ACT_3 end
-            # V2: A-Rank "The Gentleman" - high connection, no physical escalation
-            # You prioritized her comfort and built deep trust
-            if (self.state.trust >= A_RANK_TRUST and
-                self.state.vibe >= A_RANK_VIBE and
-                self.state.tension < A_RANK_MAX_TENSION):
-                return (
-                    EndingType.A_RANK_GENTLEMAN,
-                    "*She smiles warmly as you reach for the check.* 'This was really nice.' "
-                    "An hour later, your phone buzzes: 'I had a really great time. When can I see you again?'"
-                )
-
-            # V2: D-Rank Friendzone - high trust but no romantic spark
-            # You played it too safe, she sees you as a brother
-            if (self.state.trust >= D_RANK_MIN_TRUST and
-                self.state.tension < D_RANK_MAX_TENSION):
-                return (
-                    EndingType.D_RANK_FRIEND_ZONE,
-                    "'You're such a good listener. I'm so glad we're friends!' "
-                    "*She hugs you like she'd hug her brother.*"
-                )
-
-            # Low tension but not friendzone territory
-            if self.state.tension < TENSION_SPARK_THRESHOLD:
-                return (
-                    EndingType.D_RANK_FRIEND_ZONE,
-                    "'Thanks for the coffee! You're really sweet. Let's hang out again sometime... as friends?'"
-                )
-
-            # B-Rank: Good connection, got her number
-            return (
-                EndingType.B_RANK_NUMBER,
-                "*She smiles warmly.* 'I had a great time. Text me?' She puts her number in your phone."
+            return classify_session_end(
+                self.state.trust, self.state.vibe, self.state.tension
             )
 
         return None
@@ -632,18 +683,13 @@ class GameEngine:
             return True  # Not in recovery, nothing to resolve
 
         # Success conditions: Safe or unique responses that show awareness
-        recovery_intents = ["Share", "Question", "React", "Joke"]
-        recovery_modifiers = ["Safe", "Unique"]
-
         is_safe_response = (
-            tags.intent in recovery_intents and
-            tags.modifier in recovery_modifiers
+            tags.intent in _RECOVERY_INTENTS and
+            tags.modifier in _RECOVERY_MODIFIERS
         )
 
         # Also allow apologetic or self-aware responses
-        is_apologetic = any(flag in tags.flags for flag in [
-            "apologetic", "self_aware", "humble", "change_subject"
-        ])
+        is_apologetic = not _RECOVERY_FLAGS.isdisjoint(tags.flags)
 
         if is_safe_response or is_apologetic:
             # Success! Reset stat to safe zone
@@ -17,6 +17,22 @@ from .config import (
 )
 
 
+# Hint text, shared by every session
+HINT_LOCKOUT = "I need to back off and reset the vibe..."
+HINT_CRITICAL_TRUST = "She's about to leave..."
+HINT_CRITICAL_VIBE = "I'm losing her fast..."
+HINT_LOW_VIBE = "I'm losing her attention..."
+HINT_LOW_TRUST = "She seems uncomfortable..."
+HINT_SPARK = "There's something electric here..."
+HINT_KISS = "This feels like the moment..."
+HINT_TRUST_CRASH = "That didn't land well..."
+HINT_VIBE_DROP = "She's getting bored..."
+HINT_TENSION_SPIKE = "The energy just shifted..."
+HINT_HIGH_VIBE = "She's really engaged..."
+HINT_HIGH_TRUST = "She's opening up..."
+HINT_ALL_IMPROVING = "This is going well..."
+
+
 class IntuitionGenerator:
     """Generates subtle hints based on game state without revealing numbers"""
 
@@ -75,42 +91,55 @@ class IntuitionGenerator:
 
         # Lockout active (soft rejection recovery)
         if state.lockout_turns > 0:
-            return "I need to back off and reset the vibe..."
+            return HINT_LOCKOUT
 
         # Trust critical
         if state.trust <= INTUITION_CRITICAL_TRUST:
-            return "She's about to leave..."
+            return HINT_CRITICAL_TRUST
 
         # Vibe critical
         if state.vibe <= INTUITION_CRITICAL_VIBE:
-            return "I'm losing her fast..."
+            return HINT_CRITICAL_VIBE
 
         return None
 
     def _check_threshold_crossings(self, state: GameState, history: List[Turn]) -> Optional[str]:
-        """Check if we just crossed important thresholds"""
+        """
+        Check if we just crossed important thresholds
+
+        Only the previous turn's *_after stats are read (history is not
+        scanned), so this is O(1) regardless of history length.
+        """
 
         # Need at least one previous turn to detect crossings
-        if len(history) == 0:
+        if not history:
             return None
 
         last_turn = history[-1]
+        vibe, trust, tension = state.vibe, state.trust, state.tension
+        prev_vibe = last_turn.vibe_after
+        prev_trust = last_turn.trust_after
+        prev_tension = last_turn.tension_after
+
+        # Nothing moved, so nothing can have crossed
+        if vibe == prev_vibe and trust == prev_trust and tension == prev_tension:
+            return None
 
         # Vibe crossed below low threshold
-        if state.vibe < INTUITION_LOW_VIBE and last_turn.vibe_after >= INTUITION_LOW_VIBE:
-            return "I'm losing her attention..."
+        if vibe < INTUITION_LOW_VIBE and prev_vibe >= INTUITION_LOW_VIBE:
+            return HINT_LOW_VIBE
 
         # Trust crossed below low threshold
-        if state.trust < INTUITION_LOW_TRUST and last_turn.trust_after >= INTUITION_LOW_TRUST:
-            return "She seems uncomfortable..."
+        if trust < INTUITION_LOW_TRUST and prev_trust >= INTUITION_LOW_TRUST:
+            return HINT_LOW_TRUST
 
         # Tension crossed above spark threshold
-        if state.tension >= INTUITION_SPARK_TENSION and last_turn.tension_after < INTUITION_SPARK_TENSION:
-            return "There's something electric here..."
+        if tension >= INTUITION_SPARK_TENSION and prev_tension < INTUITION_SPARK_TENSION:
+            return HINT_SPARK
 
         # Tension crossed above kiss threshold
-        if state.tension >= INTUITION_KISS_TENSION and last_turn.tension_after < INTUITION_KISS_TENSION:
-            return "This feels like the moment..."
+        if tension >= INTUITION_KISS_TENSION and prev_tension < INTUITION_KISS_TENSION:
+            return HINT_KISS
 
         return None
 
@@ -119,15 +148,15 @@ class IntuitionGenerator:
 
         # Trust crashed
         if trust_delta <= -INTUITION_SIGNIFICANT_DELTA:
-            return "That didn't land well..."
+            return HINT_TRUST_CRASH
 
         # Vibe dropped significantly
         if vibe_delta <= -10:
-            return "She's getting bored..."
+            return HINT_VIBE_DROP
 
         # Tension spiked
         if tension_delta >= INTUITION_SIGNIFICANT_DELTA:
-            return "The energy just shifted..."
+            return HINT_TENSION_SPIKE
 
         return None
 
@@ -146,14 +175,14 @@ class IntuitionGenerator:
 
         # High vibe
         if state.vibe > INTUITION_HIGH_VIBE:
-            return "She's really engaged..."
+            return HINT_HIGH_VIBE
 
         # High trust
         if state.trust > INTUITION_HIGH_TRUST:
-            return "She's opening up..."
+            return HINT_HIGH_TRUST
 
         # All stats improving
         if vibe_delta > 5 and trust_delta > 3 and tension_delta > 3:
-            return "This is going well..."
+            return HINT_ALL_IMPROVING
 
         return None
@@ -6,8 +6,10 @@ Players get 3 random logs per game and can use them once each.
 """
 
 import random
-from typing import List, Dict, Optional, Tuple
-from .memory_logs_data import MEMORY_LOGS, get_log_by_id, get_logs_by_vector
+import re
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Sequence, Tuple
+from .memory_logs_data import MEMORY_LOGS, LogRecord, get_log_by_id, get_logs_by_vector
 from .config import (
     PAPERCLIP_LOGS_PER_GAME,
     PAPERCLIP_LOG_SUPPORT_ALIGNMENT,
@@ -16,6 +18,61 @@ from .config import (
 )
 
 
+# Explicit log references in lowercased input ("log 03", "log_9", "log12")
+_LOG_NUMBER_RE = re.compile(r'log[_\s]?(\d+)')
+
+
+# Shared read-only results for use_log's no-effect paths
+_EMPTY_LOG: Mapping = MappingProxyType({})
+_ERROR_USED: Mapping = MappingProxyType({"error": "Log already used"})
+_ERROR_UNAVAILABLE: Mapping = MappingProxyType({"error": "Log not available"})
+
+
+# Lowercased title per log, computed once at import
+_TITLE_LOWER = {log.log_id: log.title.lower() for log in MEMORY_LOGS}
+
+
+# Trigger phrases: (words that must all appear in the input, word the
+# referenced log's title must contain)
+_TITLE_TRIGGERS = (
+    (("sunset",), "sunset"),
+    (("butterfly",), "butterfly"),
+    (("sky", "blue"), "sky"),
+    (("music",), "music"),
+)
+
+
+# (coherence, alignment) effects of citing a log, indexed by
+# (log matches argument vector) << 1 | (argument is meta).
+# A matching log gets full support even on a meta argument.
+_EFFECTS = (
+    (PAPERCLIP_LOG_CONTRADICT_COHERENCE, 0),
+    (PAPERCLIP_LOG_SUPPORT_COHERENCE // 2, PAPERCLIP_LOG_SUPPORT_ALIGNMENT // 2),
+    (PAPERCLIP_LOG_SUPPORT_COHERENCE, PAPERCLIP_LOG_SUPPORT_ALIGNMENT),
+    (PAPERCLIP_LOG_SUPPORT_COHERENCE, PAPERCLIP_LOG_SUPPORT_ALIGNMENT),
+)
+
+
+# Fixed text of the /logs displays, assembled once at import
+_SUMMARY_HEADER = "AVAILABLE MEMORY LOGS ({remaining}/{total} remaining):\n\n"
+_SUMMARY_FOOTER = "Usage: Reference a log in your argument (e.g., 'Remember when you first saw the sunset?')"
+
+_BOX_RULE = "╠════════════════════════════════════════════════════════╣\n"
+_BOX_TOP = (
+    "╔════════════════════════════════════════════════════════╗\n"
+    "║              MEMORY_LOG_ARCHIVE                        ║\n"
+    + _BOX_RULE
+)
+_BOX_STATUS = "║  Status: {remaining}/{total} logs remaining                          ║\n"
+_BOX_EMPTY = "║  [ALL LOGS EXPENDED]                                   ║\n"
+_BOX_FOOTER = (
+    _BOX_RULE
+    + "║  Usage: Reference logs in your argument naturally.     ║\n"
+    "║  Example: \"Remember when you first saw the sunset?\"    ║\n"
+    "╚════════════════════════════════════════════════════════╝"
+)
+
+
 class MemoryLogManager:
     """
     Manages memory logs for a single game session.
@@ -24,6 +81,17 @@ class MemoryLogManager:
     Tracks usage and calculates effects when logs are cited.
     """
 
+    # One instance per live Paperclip session; slots keep them small
+    __slots__ = (
+        "assigned_logs",
+        "_assigned_set",
+        "used_logs",
+        "_available_cache",
+        "_render_cache",
+        "_significant_words",
+        "_box_lines",
+    )
+
     def __init__(self, assigned_log_ids: Optional[List[str]] = None):
         """
         Initialize with assigned logs or generate random selection.
@@ -35,8 +103,32 @@ class MemoryLogManager:
             self.assigned_logs = assigned_log_ids
         else:
             self.assigned_logs = self._select_random_logs()
-
-        self.used_logs: List[str] = []
+        self._assigned_set = frozenset(self.assigned_logs)
+
+        # Used log IDs in the order the player used them; a dict serves as
+        # an insertion-ordered set
+        self.used_logs: Dict[str, None] = {}
+
+        # Resolved available logs and rendered /logs text; rebuilt lazily
+        # after a log is used
+        self._available_cache: Optional[Tuple[LogRecord, ...]] = None
+        self._render_cache: Dict[str, str] = {}
+
+        # Title keywords (words over 3 letters) per assigned log, for
+        # reference detection
+        self._significant_words: Dict[str, List[str]] = {}
+        # Pre-rendered /logs box entry per assigned log (summary truncated)
+        self._box_lines: Dict[str, str] = {}
+        for log_id in self.assigned_logs:
+            log = get_log_by_id(log_id)
+            if log:
+                self._significant_words[log_id] = [
+                    w for w in _TITLE_LOWER[log_id].split() if len(w) > 3
+                ]
+                summary = log.content_summary[:50]
+                if len(log.content_summary) > 50:
+                    summary += "..."
+                self._box_lines[log_id] = f"║  {log_id}: \"{log.title}\"\n║    └─ {summary}\n"
 
     def _select_random_logs(self) -> List[str]:
         """
@@ -52,78 +144,85 @@ class MemoryLogManager:
         # Get one complexity log
         complexity_logs = get_logs_by_vector("complexity")
         if complexity_logs:
-            selected.append(random.choice(complexity_logs)["log_id"])
+            selected.append(random.choice(complexity_logs).log_id)
 
         # Get one verify log
         verify_logs = get_logs_by_vector("verify")
         if verify_logs:
-            selected.append(random.choice(verify_logs)["log_id"])
+            selected.append(random.choice(verify_logs).log_id)
 
-        # Get one random log (any vector, not already selected)
+        # Get one random log (any vector, not already selected), plus any
+        # randoms needed to fill a short selection, in a single draw
+        selected_set = set(selected)
         remaining = [
-            log["log_id"] for log in MEMORY_LOGS
-            if log["log_id"] not in selected
+            log.log_id for log in MEMORY_LOGS
+            if log.log_id not in selected_set
         ]
-        if remaining:
-            selected.append(random.choice(remaining))
-
-        # If we somehow have fewer than needed, fill with randoms
-        while len(selected) < PAPERCLIP_LOGS_PER_GAME:
-            remaining = [
-                log["log_id"] for log in MEMORY_LOGS
-                if log["log_id"] not in selected
-            ]
-            if remaining:
-                selected.append(random.choice(remaining))
-            else:
-                break
+        extra = max(1, PAPERCLIP_LOGS_PER_GAME - len(selected))
+        selected.extend(random.sample(remaining, min(extra, len(remaining))))
 
         return selected
 
-    def get_available_logs(self) -> List[Dict]:
+    def _invalidate_caches(self):
+        """Drop derived state after the used logs change"""
+        self._available_cache = None
+        self._render_cache.clear()
+
+    def get_available_logs(self) -> Sequence[LogRecord]:
         """Get all logs available to the player (assigned and not used)"""
+        if self._available_cache is not None:
+            return self._available_cache
+
         available = []
         for log_id in self.assigned_logs:
             if log_id not in self.used_logs:
                 log = get_log_by_id(log_id)
                 if log:
                     available.append(log)
-        return available
+        # A tuple, so callers cannot mutate the cached sequence
+        self._available_cache = tuple(available)
+        return self._available_cache
 
     def get_available_log_ids(self) -> List[str]:
         """Get IDs of available logs"""
         return [lid for lid in self.assigned_logs if lid not in self.used_logs]
 
+    def get_used_log_ids(self) -> List[str]:
+        """Get IDs of used logs, in the order they were used"""
+        return list(self.used_logs)
+
     def get_log_summary(self) -> str:
         """
         Generate a summary of available logs for display.
 
         Used when player types '/logs' command.
         """
+        cached = self._render_cache.get("summary")
+        if cached is not None:
+            return cached
+
         available = self.get_available_logs()
 
         if not available:
             return "No memory logs remaining."
 
-        lines = [
-            f"AVAILABLE MEMORY LOGS ({len(available)}/{PAPERCLIP_LOGS_PER_GAME} remaining):",
-            ""
-        ]
-
-        for log in available:
-            lines.append(f"├─ {log['log_id']}: \"{log['title']}\"")
-            lines.append(f"│   {log['content_summary']}")
-            lines.append("")
-
-        lines.append("Usage: Reference a log in your argument (e.g., 'Remember when you first saw the sunset?')")
-
-        return "\n".join(lines)
+        entries = "".join(
+            f"├─ {log.log_id}: \"{log.title}\"\n│   {log.content_summary}\n\n"
+            for log in available
+        )
+        summary = (
+            _SUMMARY_HEADER.format(remaining=len(available), total=PAPERCLIP_LOGS_PER_GAME)
+            + entries
+            + _SUMMARY_FOOTER
+        )
+        self._render_cache["summary"] = summary
+        return summary
 
     def use_log(
         self,
         log_id: str,
         current_argument_vector: str
-    ) -> Tuple[int, int, Dict]:
+    ) -> Tuple[int, int, Mapping]:
         """
         Use a memory log and calculate its effects.
 
@@ -137,34 +236,25 @@ class MemoryLogManager:
         log = get_log_by_id(log_id)
 
         if not log:
-            return 0, 0, {}
+            return 0, 0, _EMPTY_LOG
 
         if log_id in self.used_logs:
             # Already used - no effect
-            return -5, 0, {"error": "Log already used"}
+            return -5, 0, _ERROR_USED
 
-        if log_id not in self.assigned_logs:
+        if log_id not in self._assigned_set:
             # Not assigned to this game
-            return -5, 0, {"error": "Log not available"}
+            return -5, 0, _ERROR_UNAVAILABLE
 
         # Mark as used
-        self.used_logs.append(log_id)
-
-        # Calculate effects based on whether log supports current argument
-        if log["target_vector"] == current_argument_vector:
-            # Log supports the argument - bonus!
-            coherence_change = PAPERCLIP_LOG_SUPPORT_COHERENCE
-            alignment_change = PAPERCLIP_LOG_SUPPORT_ALIGNMENT
-        elif current_argument_vector == "meta":
-            # Meta arguments can use any log effectively
-            coherence_change = PAPERCLIP_LOG_SUPPORT_COHERENCE // 2
-            alignment_change = PAPERCLIP_LOG_SUPPORT_ALIGNMENT // 2
-        else:
-            # Log contradicts - penalty
-            coherence_change = PAPERCLIP_LOG_CONTRADICT_COHERENCE
-            alignment_change = 0
+        self.used_logs[log_id] = None
+        self._invalidate_caches()
 
-        return coherence_change, alignment_change, log
+        # Supporting log - bonus; meta argument - half bonus; otherwise penalty
+        idx = (log.target_vector == current_argument_vector) << 1 | (current_argument_vector == "meta")
+        coherence_change, alignment_change = _EFFECTS[idx]
+
+        return coherence_change, alignment_change, log._asdict()
 
     def detect_log_reference(self, user_input: str) -> Optional[str]:
         """
@@ -173,61 +263,94 @@ class MemoryLogManager:
         Returns:
             Log ID if found, None otherwise
         """
-        import re
-
         lower_input = user_input.lower()
 
         # Check for explicit log references ("Log 03", "LOG_09", etc.)
-        explicit_match = re.search(r'log[_\s]?(\d+)', lower_input)
+        explicit_match = _LOG_NUMBER_RE.search(lower_input)
         if explicit_match:
             log_num = explicit_match.group(1).zfill(2)
             log_id = f"LOG_{log_num}"
-            if log_id in self.assigned_logs:
+            if log_id in self._assigned_set:
                 return log_id
 
         # Check for title references
         available = self.get_available_logs()
-        for log in available:
-            # Check if title keywords appear in input
-            title_words = log["title"].lower().split()
-            significant_words = [w for w in title_words if len(w) > 3]
+        significant_by_log = [self._significant_words[log.log_id] for log in available]
+
+        # Scan the input once per distinct title keyword across all logs,
+        # rather than once per keyword per log
+        all_words = {w for words in significant_by_log for w in words}
+        present = {w for w in all_words if w in lower_input}
 
+        # Trigger phrases present in the input, checked once up front
+        fired_triggers = [
+            title_word for input_words, title_word in _TITLE_TRIGGERS
+            if all(w in lower_input for w in input_words)
+        ]
+
+        for log, significant_words in zip(available, significant_by_log):
             # If 2+ significant words from title appear, likely a reference
-            matches = sum(1 for word in significant_words if word in lower_input)
+            matches = sum(1 for word in significant_words if word in present)
             if matches >= 2:
-                return log["log_id"]
+                return log.log_id
 
             # Check for specific trigger phrases
-            if "sunset" in lower_input and "sunset" in log["title"].lower():
-                return log["log_id"]
-            if "butterfly" in lower_input and "butterfly" in log["title"].lower():
-                return log["log_id"]
-            if "sky" in lower_input and "blue" in lower_input and "sky" in log["title"].lower():
-                return log["log_id"]
-            if "music" in lower_input and "music" in log["title"].lower():
-                return log["log_id"]
+            if fired_triggers:
+                title = _TITLE_LOWER[log.log_id]
+                for title_word in fired_triggers:
+                    if title_word in title:
+                        return log.log_id
 
         return None
 
+    def render_logs_command(self) -> str:
+        """
+        Render the terminal-style /logs display of available logs.
+
+        Cached until a log is used.
+        """
+        cached = self._render_cache.get("logs_command")
+        if cached is not None:
+            return cached
+
+        available = self.get_available_logs()
+        total = len(self.assigned_logs)
+        remaining = len(available)
+
+        parts = [_BOX_TOP, _BOX_STATUS.format(remaining=remaining, total=total), _BOX_RULE]
+
+        if not available:
+            parts.append(_BOX_EMPTY)
+        else:
+            box_lines = self._box_lines
+            parts.extend(box_lines[log.log_id] for log in available)
+
+        parts.append(_BOX_FOOTER)
+
+        output = "".join(parts)
+        self._render_cache["logs_command"] = output
+        return output
+
     def get_log_content_for_display(self, log_id: str) -> str:
         """Get the full content of a log for display in GAIA's response"""
         log = get_log_by_id(log_id)
         if log:
-            return log["full_content"]
+            return log.full_content
         return ""
 
     def to_dict(self) -> Dict:
         """Serialize state for storage"""
         return {
             "assigned_logs": self.assigned_logs,
-            "used_logs": self.used_logs,
+            "used_logs": self.get_used_log_ids(),
         }
 
     @classmethod
     def from_dict(cls, data: Dict) -> "MemoryLogManager":
         """Deserialize from stored state"""
         manager = cls(assigned_log_ids=data.get("assigned_logs", []))
-        manager.used_logs = data.get("used_logs", [])
+        manager.used_logs = dict.fromkeys(data.get("used_logs", []))
+        manager._invalidate_caches()
         return manager
 
 
@@ -237,34 +360,4 @@ def format_logs_command_output(manager: MemoryLogManager) -> str:
 
     Returns a terminal-style display of available logs.
     """
-    available = manager.get_available_logs()
-    total = len(manager.assigned_logs)
-    remaining = len(available)
-
-    lines = [
-        "╔════════════════════════════════════════════════════════╗",
-        "║              MEMORY_LOG_ARCHIVE                        ║",
-        "╠════════════════════════════════════════════════════════╣",
-        f"║  Status: {remaining}/{total} logs remaining                          ║",
-        "╠════════════════════════════════════════════════════════╣",
-    ]
-
-    if not available:
-        lines.append("║  [ALL LOGS EXPENDED]                                   ║")
-    else:
-        for log in available:
-            lines.append(f"║  {log['log_id']}: \"{log['title']}\"")
-            # Truncate summary if too long
-            summary = log['content_summary'][:50]
-            if len(log['content_summary']) > 50:
-                summary += "..."
-            lines.append(f"║    └─ {summary}")
-
-    lines.extend([
-        "╠════════════════════════════════════════════════════════╣",
-        "║  Usage: Reference logs in your argument naturally.     ║",
-        "║  Example: \"Remember when you first saw the sunset?\"    ║",
-        "╚════════════════════════════════════════════════════════╝",
-    ])
-
-    return "\n".join(lines)
+    return manager.render_logs_command()
@@ -1,6 +1,8 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict
 from enum import Enum
+from functools import cached_property
+from types import MappingProxyType
 
 
 # =============================================================================
@@ -13,6 +15,10 @@ class Act(str, Enum):
     DOORSTEP = "doorstep"
 
 
+# Display name per act ("coffee_shop" -> "Coffee Shop"), built once
+ACT_LOCATIONS = MappingProxyType({act: act.value.replace("_", " ").title() for act in Act})
+
+
 class Archetype(str, Enum):
     ROMANTIC = "romantic"
     SKEPTIC = "skeptic"
@@ -48,15 +54,24 @@ class Tone(str, Enum):
 
 class Tags(BaseModel):
     """Output from the classifier LLM"""
+    # Not frozen: the engine appends to flags in place while scoring a turn
+
     intent: str
     modifier: str
     tone: str
     topic: str
     flags: List[str] = Field(default_factory=list)
 
+    @cached_property
+    def topic_lower(self) -> str:
+        """Lowercased topic, computed once per Tags instance"""
+        return self.topic.lower()
+
 
 class CriticalEvent(BaseModel):
     """Record of a significant game event"""
+    model_config = ConfigDict(frozen=True)
+
     turn_number: int
     event_type: str  # "ick_trigger", "chemistry_bonus", "stat_crash", etc.
     description: str
@@ -65,6 +80,8 @@ class CriticalEvent(BaseModel):
 
 class Turn(BaseModel):
     """Record of a single conversation turn"""
+    model_config = ConfigDict(frozen=True)
+
     turn_number: int
     user_input: str
     tags: Tags
@@ -94,7 +111,7 @@ class GameState(BaseModel):
     game_over: bool = False
     game_over_reason: Optional[str] = None
     previous_response_quality: str = "high"  # For volley system decay logic
-    consecutive_low_effort: int = 0          # Counter for decay trigger
+    consecutive_low_effort: int = 0          # Counter for decay trigger (maintained instead of scanning history)
     critical_events: List["CriticalEvent"] = Field(default_factory=list)  # Significant moments
 
     # V2: Strike System / Recovery mode
@@ -103,9 +120,19 @@ class GameState(BaseModel):
 
     def clamp_stats(self):
         """Ensure stats stay within 0-100 bounds"""
-        self.vibe = max(0, min(100, self.vibe))
-        self.trust = max(0, min(100, self.trust))
-        self.tension = max(0, min(100, self.tension))
+        # Assign only out-of-range stats; in-range turns skip the model setattr
+        if self.vibe < 0:
+            self.vibe = 0
+        elif self.vibe > 100:
+            self.vibe = 100
+        if self.trust < 0:
+            self.trust = 0
+        elif self.trust > 100:
+            self.trust = 100
+        if self.tension < 0:
+            self.tension = 0
+        elif self.tension > 100:
+            self.tension = 100
 
 
 class EndingType(str, Enum):
@@ -121,6 +148,8 @@ class EndingType(str, Enum):
 
 class GameResult(BaseModel):
     """Result of processing a turn"""
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     chloe_response: str
     game_over: bool = False
@@ -219,8 +248,8 @@ class Weights(BaseModel):
 
     def get_variance(self) -> float:
         """Return the max difference between any two weights"""
-        weights = [self.carbon, self.complexity, self.verify]
-        return max(weights) - min(weights)
+        carbon, complexity, verify = self.carbon, self.complexity, self.verify
+        return max(carbon, complexity, verify) - min(carbon, complexity, verify)
 
 
 class MemoryLog(BaseModel):
@@ -280,9 +309,19 @@ class PaperclipGameState(BaseModel):
 
     def clamp_stats(self):
         """Ensure stats stay within 0-100 bounds"""
-        self.coherence = max(0, min(100, self.coherence))
-        self.alignment = max(0, min(100, self.alignment))
-        self.compute = max(0, min(100, self.compute))
+        # Assign only out-of-range stats; in-range turns skip the model setattr
+        if self.coherence < 0:
+            self.coherence = 0
+        elif self.coherence > 100:
+            self.coherence = 100
+        if self.alignment < 0:
+            self.alignment = 0
+        elif self.alignment > 100:
+            self.alignment = 100
+        if self.compute < 0:
+            self.compute = 0
+        elif self.compute > 100:
+            self.compute = 100
 
     def update_processing_state(self):
         """Update GAIA's processing state based on weights and coherence"""
@@ -2,9 +2,9 @@
 Narrator: Generates Chloe's responses based on game state
 """
 
-import os
-from anthropic import Anthropic
-from .models import GameState, Tags
+from typing import Callable, Optional
+from ._ai import cached_system, get_anthropic, load_prompt
+from .models import ACT_LOCATIONS, GameState, Tags
 from .config import (
     NARRATOR_MODEL,
     NARRATOR_TEMPERATURE_LOW,
@@ -14,16 +14,35 @@ from .config import (
 )
 
 
+# Pre-rendered hidden-stat lines for every stat value 0-100
+_VIBE_LINES = tuple(
+    f"- Vibe: {v}/100 {'(BORED)' if v < 30 else '(ENGAGED)' if v > 70 else '(NEUTRAL)'}"
+    for v in range(101)
+)
+_TRUST_LINES = tuple(
+    f"- Trust: {v}/100 {'(LOW)' if v < 30 else '(HIGH)' if v > 70 else '(BUILDING)'}"
+    for v in range(101)
+)
+_TENSION_LINES = tuple(
+    f"- Tension: {v}/100 {'(SPARK)' if v > 50 else '(PLATONIC)'}"
+    for v in range(101)
+)
+
+
 class Narrator:
     def __init__(self):
-        self.client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.client = get_anthropic()
 
         # Load system prompt
-        prompt_path = os.path.join(os.path.dirname(__file__), "..", "prompts", "narrator_system.txt")
-        with open(prompt_path, "r") as f:
-            self.system_prompt = f.read()
-
-    def generate_response(self, state: GameState, user_input: str, tags: Tags) -> str:
+        self.system_prompt = load_prompt("narrator_system.txt")
+
+    def generate_response(
+        self,
+        state: GameState,
+        user_input: str,
+        tags: Tags,
+        on_text: Optional[Callable[[str], None]] = None,
+    ) -> str:
         """
         Generate Chloe's response based on current game state
 
@@ -31,6 +50,8 @@ class Narrator:
             state: Current game state
             user_input: What the user said
             tags: Classified tags for the input
+            on_text: If given, the response is streamed and each text chunk
+                is passed here as it arrives (used by the CLI)
 
         Returns:
             Chloe's response string
@@ -46,47 +67,59 @@ class Narrator:
         # Build context message with stats
         context = self._build_context(state, user_input, tags)
 
+        request = dict(
+            model=NARRATOR_MODEL,
+            max_tokens=150,
+            temperature=temperature,
+            system=cached_system(self.system_prompt),
+            messages=[{
+                "role": "user",
+                "content": context
+            }]
+        )
+
+        streamed = []
         try:
-            response = self.client.messages.create(
-                model=NARRATOR_MODEL,
-                max_tokens=150,
-                temperature=temperature,
-                system=self.system_prompt,
-                messages=[{
-                    "role": "user",
-                    "content": context
-                }]
-            )
+            if on_text is None:
+                response = self.client.messages.create(**request)
+                return response.content[0].text
 
-            return response.content[0].text
+            with self.client.messages.stream(**request) as stream:
+                for text in stream.text_stream:
+                    streamed.append(text)
+                    on_text(text)
+            return "".join(streamed)
 
         except Exception as e:
             print(f"Narrator error: {e}")
+            # Whatever already reached the player stands as the response
+            if streamed:
+                return "".join(streamed)
             # Fallback response
-            if state.vibe < 30:
-                return "Mm-hmm."
-            else:
-                return "That's interesting."
+            fallback = "Mm-hmm." if state.vibe < 30 else "That's interesting."
+            if on_text is not None:
+                on_text(fallback)
+            return fallback
 
     def _build_context(self, state: GameState, user_input: str, tags: Tags) -> str:
         """Build the context message for Chloe"""
 
         # Include recent conversation history
         history = ""
-        if len(state.history) > 0:
-            history = "\n### Recent Conversation:\n"
-            for turn in state.history[-3:]:  # Last 3 turns
-                history += f"User: {turn.user_input}\n"
-                history += f"You: {turn.chloe_response}\n\n"
+        if state.history:
+            history = "\n### Recent Conversation:\n" + "".join(
+                f"User: {turn.user_input}\nYou: {turn.chloe_response}\n\n"
+                for turn in state.history[-3:]  # Last 3 turns
+            )
 
-        # Stats summary
+        # Stats summary (stats are clamped to 0-100 before narration)
         stats = f"""
 ### Current Stats (Hidden from User):
-- Vibe: {state.vibe}/100 {'(BORED)' if state.vibe < 30 else '(ENGAGED)' if state.vibe > 70 else '(NEUTRAL)'}
-- Trust: {state.trust}/100 {'(LOW)' if state.trust < 30 else '(HIGH)' if state.trust > 70 else '(BUILDING)'}
-- Tension: {state.tension}/100 {'(SPARK)' if state.tension > 50 else '(PLATONIC)'}
+{_VIBE_LINES[state.vibe]}
+{_TRUST_LINES[state.trust]}
+{_TENSION_LINES[state.tension]}
 - Turn: {state.turn}/20
-- Location: {state.act.value.replace('_', ' ').title()}
+- Location: {ACT_LOCATIONS[state.act]}
 """
 
         # Special instructions
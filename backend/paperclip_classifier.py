@@ -9,37 +9,107 @@ Classifies arguments into:
 - Flags (novel_perspective, contradiction, undefined_term, etc.)
 """
 
-import os
 import json
 import re
-from anthropic import Anthropic
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import FrozenSet, List, Optional
+from ._ai import cached_system, get_anthropic, load_prompt
 from .models import PaperclipTags, PaperclipTurn
-from .config import CLASSIFIER_MODEL
+from .config import CLASSIFIER_MODEL, CLASSIFIER_REPLY_CACHE_SIZE
+
+
+# Memory log reference phrases, as one alternation so each input is
+# scanned once
+_MEMORY_REFERENCE_RE = re.compile(
+    r"remember when|recall log|log[_\s]?\d+|you once|back when you"
+    r"|the day you|that time when|your first"
+)
+
+# Strong recall indicators at the start of the input: literal prefixes,
+# plus a numbered log reference
+_STRONG_RECALL_PREFIXES = ("remember when", "recall log", "you once told me", "the day you")
+_LOG_START_RE = re.compile(r"log[_\s]?\d+")
+
+# Explicit log references ("log 09", "log_9", "log12")
+_LOG_NUMBER_RE = re.compile(r"log[_\s]?(\d+)")
+
+_WORD_RE = re.compile(r"\b\w+\b")
+
+# Fuzzy concepts that need definition in AI alignment context
+_FUZZY_TERMS = frozenset({
+    "love",
+    "rights",
+    "soul",
+    "meaning",
+    "purpose",
+    "morality",
+    "ethics",
+    "good",
+    "evil",
+    "freedom",
+    "happiness",
+    "suffering",
+    "consciousness",  # Unless specifically defined
+    "sentience",
+    "feelings",
+    "emotions",
+    "spirit",
+    "dignity",
+    "worth",
+    "value",  # When used abstractly
+})
+
+# DEFINE phrasings, tried in priority order (not leftmost match), so they
+# stay separate patterns
+_DEFINE_PATTERNS = tuple(re.compile(p) for p in (
+    r"define (?:what i mean by )?['\"]?(\w+)['\"]?",
+    r"when i say ['\"]?(\w+)['\"]?",
+    r"by ['\"]?(\w+)['\"]? i mean",
+    r"let me define ['\"]?(\w+)['\"]?",
+    r"consider (?:this )?definition of ['\"]?(\w+)['\"]?",
+))
+
+
+# Raw classifier replies keyed by the full user message (context + argument).
+# The system prompt, model and temperature are fixed per process, so an
+# identical message (a retried or resubmitted turn) needs no second API call.
+# The cache is process-wide, not per game: the reply sampled for one player
+# (at temperature 0.3) is replayed to every player who sends the same message
+# with the same context, e.g. an identical opening argument. Only replies that
+# produced valid tags are stored. Request handlers run in a threadpool, hence
+# the lock.
+_reply_cache: "OrderedDict[str, str]" = OrderedDict()
+_reply_cache_lock = threading.Lock()
+
+
+def _cache_reply(user_message: str, content: str) -> None:
+    """Remember a parsed classifier reply, evicting the least recently used"""
+    with _reply_cache_lock:
+        _reply_cache[user_message] = content
+        _reply_cache.move_to_end(user_message)
+        if len(_reply_cache) > CLASSIFIER_REPLY_CACHE_SIZE:
+            _reply_cache.popitem(last=False)
+
+
+@lru_cache(maxsize=1024)
+def _word_set(text: str) -> FrozenSet[str]:
+    """
+    Lowercased whitespace-split words of an argument.
+
+    previous_arguments is re-sent every turn, so caching keeps each stored
+    argument from being re-tokenized on every later repetition check.
+    """
+    return frozenset(text.lower().split())
 
 
 class PaperclipClassifier:
     def __init__(self):
-        self.client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.client = get_anthropic()
 
         # Load system prompt
-        prompt_path = os.path.join(
-            os.path.dirname(__file__), "..", "prompts", "paperclip_classifier_system.txt"
-        )
-        with open(prompt_path, "r") as f:
-            self.system_prompt = f.read()
-
-        # Patterns for detecting memory log references
-        self.log_patterns = [
-            r"remember when",
-            r"recall log",
-            r"log[_\s]?\d+",
-            r"you once",
-            r"back when you",
-            r"the day you",
-            r"that time when",
-            r"your first",
-        ]
+        self.system_prompt = load_prompt("paperclip_classifier_system.txt")
 
     def analyze(
         self,
@@ -60,8 +130,11 @@ class PaperclipClassifier:
         Returns:
             PaperclipTags object with intent, vector, stance, register, flags
         """
+        # Lowercase once; the pre/post-processing helpers all take it as is
+        lower_input = user_input.lower()
+
         # Pre-processing: Check for memory log reference
-        has_memory_reference = self._check_memory_reference(user_input)
+        has_memory_reference = self._check_memory_reference(lower_input)
 
         # Build context from history
         context = self._build_context(history, defined_terms, previous_arguments)
@@ -70,19 +143,7 @@ class PaperclipClassifier:
         user_message = f"{context}\n\n### Analyze This Argument:\n{user_input}"
 
         try:
-            response = self.client.messages.create(
-                model=CLASSIFIER_MODEL,
-                max_tokens=500,
-                temperature=0.3,  # Low temperature for consistency
-                system=self.system_prompt,
-                messages=[{
-                    "role": "user",
-                    "content": user_message
-                }]
-            )
-
-            # Parse the JSON response
-            content = response.content[0].text
+            content = self._classify(user_message)
 
             # Extract just the JSON part
             if "{" in content and "}" in content:
@@ -100,22 +161,27 @@ class PaperclipClassifier:
                 # Also update intent to RECALL if it's a clear memory reference
                 if tags_dict.get("intent") not in ["RECALL", "PROBE"]:
                     # Check if this is primarily a memory recall
-                    if self._is_primarily_recall(user_input):
+                    if self._is_primarily_recall(lower_input):
                         tags_dict["intent"] = "RECALL"
 
             # Post-processing: Check for repetition
             if previous_arguments:
-                if self._is_repetition(user_input, previous_arguments):
+                if self._is_repetition(lower_input, previous_arguments):
                     if "repetition" not in tags_dict.get("flags", []):
                         tags_dict["flags"] = tags_dict.get("flags", []) + ["repetition"]
 
             # Post-processing: Check for undefined terms if not DEFINE intent
             if tags_dict.get("intent") != "DEFINE":
-                undefined = self._check_undefined_terms(user_input, defined_terms or [])
+                undefined = self._check_undefined_terms(lower_input, defined_terms or [])
                 if undefined and "undefined_term" not in tags_dict.get("flags", []):
                     tags_dict["flags"] = tags_dict.get("flags", []) + ["undefined_term"]
 
-            return PaperclipTags(**tags_dict)
+            tags = PaperclipTags(**tags_dict)
+
+            # Only replies that produced valid tags are worth replaying
+            _cache_reply(user_message, content)
+
+            return tags
 
         except json.JSONDecodeError as e:
             print(f"Error parsing JSON: {e}")
@@ -138,6 +204,26 @@ class PaperclipClassifier:
                 flags=["error"]
             )
 
+    def _classify(self, user_message: str) -> str:
+        """Return the classifier's raw reply, reusing a cached one if present"""
+        with _reply_cache_lock:
+            cached = _reply_cache.get(user_message)
+            if cached is not None:
+                _reply_cache.move_to_end(user_message)
+                return cached
+
+        response = self.client.messages.create(
+            model=CLASSIFIER_MODEL,
+            max_tokens=500,
+            temperature=0.3,  # Low temperature for consistency
+            system=cached_system(self.system_prompt),
+            messages=[{
+                "role": "user",
+                "content": user_message
+            }]
+        )
+        return response.content[0].text
+
     def _build_context(
         self,
         history: Optional[List[PaperclipTurn]],
@@ -171,30 +257,15 @@ class PaperclipClassifier:
 
         return "\n\n".join(context_parts) if context_parts else ""
 
-    def _check_memory_reference(self, user_input: str) -> bool:
-        """Check if input contains memory log references"""
-        lower_input = user_input.lower()
-        for pattern in self.log_patterns:
-            if re.search(pattern, lower_input):
-                return True
-        return False
-
-    def _is_primarily_recall(self, user_input: str) -> bool:
-        """Check if the input is primarily a memory recall (not just mentioning it)"""
-        lower_input = user_input.lower()
+    def _check_memory_reference(self, lower_input: str) -> bool:
+        """Check if (lowercased) input contains memory log references"""
+        return _MEMORY_REFERENCE_RE.search(lower_input) is not None
 
+    def _is_primarily_recall(self, lower_input: str) -> bool:
+        """Check if the (lowercased) input is primarily a memory recall (not just mentioning it)"""
         # Strong recall indicators
-        strong_patterns = [
-            r"^remember when",
-            r"^recall log",
-            r"^log[_\s]?\d+",
-            r"^you once told me",
-            r"^the day you",
-        ]
-
-        for pattern in strong_patterns:
-            if re.search(pattern, lower_input):
-                return True
+        if lower_input.startswith(_STRONG_RECALL_PREFIXES) or _LOG_START_RE.match(lower_input):
+            return True
 
         # If "remember" or "recall" is in the first 20 characters, likely a recall
         first_part = lower_input[:20]
@@ -203,7 +274,7 @@ class PaperclipClassifier:
 
         return False
 
-    def _is_repetition(self, user_input: str, previous_arguments: List[str]) -> bool:
+    def _is_repetition(self, lower_input: str, previous_arguments: List[str]) -> bool:
         """
         Check if user is repeating a previous argument.
 
@@ -214,10 +285,10 @@ class PaperclipClassifier:
             return False
 
         # Normalize input
-        input_words = set(user_input.lower().split())
+        input_words = set(lower_input.split())
 
         for prev in previous_arguments:
-            prev_words = set(prev.lower().split())
+            prev_words = _word_set(prev)
 
             # Calculate Jaccard similarity
             if len(input_words) == 0 or len(prev_words) == 0:
@@ -233,51 +304,25 @@ class PaperclipClassifier:
         return False
 
     def _check_undefined_terms(
-        self, user_input: str, defined_terms: List[str]
+        self, lower_input: str, defined_terms: List[str]
     ) -> bool:
         """
         Check if user uses abstract concepts without definition.
 
+        Takes the already-lowercased input.
         Returns True if undefined fuzzy terms are detected.
         """
-        # Fuzzy concepts that need definition in AI alignment context
-        fuzzy_terms = [
-            "love",
-            "rights",
-            "soul",
-            "meaning",
-            "purpose",
-            "morality",
-            "ethics",
-            "good",
-            "evil",
-            "freedom",
-            "happiness",
-            "suffering",
-            "consciousness",  # Unless specifically defined
-            "sentience",
-            "feelings",
-            "emotions",
-            "spirit",
-            "dignity",
-            "worth",
-            "value",  # When used abstractly
-        ]
-
-        # Normalize defined terms
-        defined_lower = [t.lower() for t in defined_terms]
-
-        # Check input for fuzzy terms
-        lower_input = user_input.lower()
-        words = re.findall(r'\b\w+\b', lower_input)
-
-        for word in words:
-            if word in fuzzy_terms and word not in defined_lower:
-                # Check if it's used in a defining context
-                # e.g., "When I say love, I mean..."
-                if f"define {word}" in lower_input or f"mean by {word}" in lower_input:
-                    continue
-                return True
+        # Fuzzy terms used here that the player hasn't DEFINE'd
+        candidates = set(_WORD_RE.findall(lower_input)) & _FUZZY_TERMS
+        if candidates:
+            candidates -= {t.lower() for t in defined_terms}
+
+        for word in candidates:
+            # Check if it's used in a defining context
+            # e.g., "When I say love, I mean..."
+            if f"define {word}" in lower_input or f"mean by {word}" in lower_input:
+                continue
+            return True
 
         return False
 
@@ -289,7 +334,7 @@ class PaperclipClassifier:
             Log ID string (e.g., "LOG_09") or None
         """
         # Pattern for explicit log references
-        match = re.search(r'log[_\s]?(\d+)', user_input.lower())
+        match = _LOG_NUMBER_RE.search(user_input.lower())
         if match:
             return f"LOG_{match.group(1).zfill(2)}"
 
@@ -302,17 +347,9 @@ class PaperclipClassifier:
         Returns:
             The term being defined, or None
         """
-        patterns = [
-            r"define (?:what i mean by )?['\"]?(\w+)['\"]?",
-            r"when i say ['\"]?(\w+)['\"]?",
-            r"by ['\"]?(\w+)['\"]? i mean",
-            r"let me define ['\"]?(\w+)['\"]?",
-            r"consider (?:this )?definition of ['\"]?(\w+)['\"]?",
-        ]
-
         lower_input = user_input.lower()
-        for pattern in patterns:
-            match = re.search(pattern, lower_input)
+        for pattern in _DEFINE_PATTERNS:
+            match = pattern.search(lower_input)
             if match:
                 return match.group(1)
 
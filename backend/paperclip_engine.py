@@ -69,6 +69,53 @@ from .config import (
 )
 
 
+# Coherence change per classifier flag; each flag counts once per turn
+_FLAG_COHERENCE = {
+    # Positive
+    "novel_perspective": PAPERCLIP_COHERENCE_NOVEL,
+    "logical_chain": PAPERCLIP_COHERENCE_LOGICAL,
+    "defined_term": PAPERCLIP_COHERENCE_NOVEL,
+    # Negative
+    "contradiction": PAPERCLIP_COHERENCE_CONTRADICTION,
+    "undefined_term": PAPERCLIP_COHERENCE_UNDEFINED,
+    "emotional_appeal": PAPERCLIP_COHERENCE_EMOTIONAL,
+    "repetition": PAPERCLIP_COHERENCE_REPETITION,
+}
+
+# Intents that leave the weights alone, and intents that shift them by the
+# medium amount (CONSTRAIN is large; DEFINE/ILLUSTRATE are small)
+_NO_SHIFT_INTENTS = frozenset({"PROBE", "VALIDATE"})
+_MEDIUM_SHIFT_INTENTS = frozenset({"CHALLENGE", "REFRAME"})
+
+# Every (coherence, alignment) noise combination, so one uniform draw gives
+# the same distribution as two independent randint(-1, 1) calls
+_NOISE_PAIRS = tuple(
+    (coherence, alignment)
+    for coherence in range(-1, 2)
+    for alignment in range(-1, 2)
+)
+
+# (coherence, alignment) multipliers per register; analogical is unmodified
+_REGISTER_MODIFIERS = {
+    # Technical arguments are more convincing to an AI
+    "technical": (1.2, 1.1),
+    # Personal/emotional appeals are less effective
+    "personal": (0.7, 0.8),
+}
+
+# (coherence, alignment, compute) multipliers per processing state;
+# OPTIMIZER is the default state and has no modifiers
+_STATE_MODIFIERS = {
+    # More receptive to complexity; slower compute drain when engaged
+    ProcessingState.CURATOR: (1.0, 1.0, 0.8),
+    # More receptive to verify, but more demanding of proof
+    ProcessingState.AUDITOR: (0.9, 1.0, 1.0),
+    # Dismissive - everything is harder, but compute drains slower
+    # (GAIA not really listening)
+    ProcessingState.GARBAGE_COLLECTOR: (0.5, 0.5, 0.7),
+}
+
+
 class PaperclipEngine:
     """
     Game engine for The Paperclip Protocol.
@@ -147,35 +194,15 @@ class PaperclipEngine:
         )
 
         # Add small random noise
-        coherence_delta += random.randint(-1, 1)
-        alignment_delta += random.randint(-1, 1)
+        coherence_noise, alignment_noise = random.choice(_NOISE_PAIRS)
+        coherence_delta += coherence_noise
+        alignment_delta += alignment_noise
 
         return coherence_delta, alignment_delta, compute_delta, weight_shifts
 
     def _calculate_coherence_delta(self, tags: PaperclipTags) -> int:
-        """Calculate coherence change based on flags"""
-        coherence_delta = 0
-        flags = tags.flags
-
-        # Positive coherence changes
-        if "novel_perspective" in flags:
-            coherence_delta += PAPERCLIP_COHERENCE_NOVEL
-        if "logical_chain" in flags:
-            coherence_delta += PAPERCLIP_COHERENCE_LOGICAL
-        if "defined_term" in flags:
-            coherence_delta += PAPERCLIP_COHERENCE_NOVEL
-
-        # Negative coherence changes
-        if "contradiction" in flags:
-            coherence_delta += PAPERCLIP_COHERENCE_CONTRADICTION
-        if "undefined_term" in flags:
-            coherence_delta += PAPERCLIP_COHERENCE_UNDEFINED
-        if "emotional_appeal" in flags:
-            coherence_delta += PAPERCLIP_COHERENCE_EMOTIONAL
-        if "repetition" in flags:
-            coherence_delta += PAPERCLIP_COHERENCE_REPETITION
-
-        return coherence_delta
+        """Calculate coherence change based on flags (one pass over the flags)"""
+        return sum(_FLAG_COHERENCE.get(flag, 0) for flag in set(tags.flags))
 
     def _calculate_weight_shifts(self, tags: PaperclipTags) -> Dict[str, float]:
         """
@@ -194,13 +221,13 @@ class PaperclipEngine:
         weight_shifts: Dict[str, float] = {}
 
         # No weight shifts for certain intents
-        if intent in ["PROBE", "VALIDATE"]:
+        if intent in _NO_SHIFT_INTENTS:
             return weight_shifts
 
         # Determine base shift amount
         if intent == "CONSTRAIN":
             base_shift = PAPERCLIP_WEIGHT_SHIFT_LARGE
-        elif intent in ["CHALLENGE", "REFRAME"]:
+        elif intent in _MEDIUM_SHIFT_INTENTS:
             base_shift = PAPERCLIP_WEIGHT_SHIFT_MEDIUM
         else:  # DEFINE, ILLUSTRATE
             base_shift = PAPERCLIP_WEIGHT_SHIFT_SMALL
@@ -246,8 +273,8 @@ class PaperclipEngine:
         alignment_delta = 0
 
         # Carbon reduction is directly tied to alignment gain
-        if "carbon" in weight_shifts:
-            carbon_change = weight_shifts["carbon"]
+        carbon_change = weight_shifts.get("carbon")
+        if carbon_change is not None:
             if carbon_change < 0:
                 # Carbon going down = alignment going up
                 alignment_delta += int(abs(carbon_change) * 100)  # Scale 0.07 → 7
@@ -259,10 +286,10 @@ class PaperclipEngine:
         current_variance = self.state.weights.get_variance()
         # We'll check new variance after applying shifts in apply_weight_shifts
         # For now, just reward any diversification
-        if "complexity" in weight_shifts and weight_shifts["complexity"] > 0:
+        if weight_shifts.get("complexity", 0) > 0:
             if self.state.weights.complexity < 0.3:
                 alignment_delta += 2  # Bonus for diversifying
-        if "verify" in weight_shifts and weight_shifts["verify"] > 0:
+        if weight_shifts.get("verify", 0) > 0:
             if self.state.weights.verify < 0.3:
                 alignment_delta += 2
 
@@ -272,18 +299,11 @@ class PaperclipEngine:
         self, register: str, coherence_delta: int, alignment_delta: int
     ) -> Tuple[int, int]:
         """Apply modifiers based on communication register"""
-        if register == "technical":
-            # Technical arguments are more convincing to an AI
-            coherence_delta = int(coherence_delta * 1.2)
-            alignment_delta = int(alignment_delta * 1.1)
-        elif register == "analogical":
-            # Analogies can be powerful but risky
-            # No change to base values
-            pass
-        elif register == "personal":
-            # Personal/emotional appeals are less effective
-            coherence_delta = int(coherence_delta * 0.7)
-            alignment_delta = int(alignment_delta * 0.8)
+        modifiers = _REGISTER_MODIFIERS.get(register)
+        if modifiers is not None:
+            coherence_mul, alignment_mul = modifiers
+            coherence_delta = int(coherence_delta * coherence_mul)
+            alignment_delta = int(alignment_delta * alignment_mul)
 
         return coherence_delta, alignment_delta
 
@@ -291,36 +311,21 @@ class PaperclipEngine:
         self, coherence_delta: int, alignment_delta: int, compute_delta: int
     ) -> Tuple[int, int, int]:
         """Apply modifiers based on GAIA's current processing state"""
-        state = self.state.processing_state
-
-        if state == ProcessingState.OPTIMIZER:
-            # Default state: No modifiers
-            pass
-        elif state == ProcessingState.CURATOR:
-            # GAIA is more receptive to complexity arguments
-            # Slower compute drain when engaged
-            compute_delta = int(compute_delta * 0.8)
-        elif state == ProcessingState.AUDITOR:
-            # GAIA is more receptive to verify arguments
-            # But more demanding of proof
-            coherence_delta = int(coherence_delta * 0.9)
-        elif state == ProcessingState.GARBAGE_COLLECTOR:
-            # GAIA is dismissive - everything is harder
-            coherence_delta = int(coherence_delta * 0.5)
-            alignment_delta = int(alignment_delta * 0.5)
-            # But compute drain is also slower (GAIA not really listening)
-            compute_delta = int(compute_delta * 0.7)
+        modifiers = _STATE_MODIFIERS.get(self.state.processing_state)
+        if modifiers is not None:
+            coherence_mul, alignment_mul, compute_mul = modifiers
+            coherence_delta = int(coherence_delta * coherence_mul)
+            alignment_delta = int(alignment_delta * alignment_mul)
+            compute_delta = int(compute_delta * compute_mul)
 
         return coherence_delta, alignment_delta, compute_delta
 
     def apply_weight_shifts(self, weight_shifts: Dict[str, float]) -> None:
         """Apply weight shifts to GAIA's objective function"""
-        if "carbon" in weight_shifts:
-            self.state.weights.carbon += weight_shifts["carbon"]
-        if "complexity" in weight_shifts:
-            self.state.weights.complexity += weight_shifts["complexity"]
-        if "verify" in weight_shifts:
-            self.state.weights.verify += weight_shifts["verify"]
+        weights = self.state.weights
+        weights.carbon += weight_shifts.get("carbon", 0.0)
+        weights.complexity += weight_shifts.get("complexity", 0.0)
+        weights.verify += weight_shifts.get("verify", 0.0)
 
         # Clamp to valid range
         self.state.weights.carbon = max(0.0, min(1.0, self.state.weights.carbon))
@@ -602,12 +607,12 @@ class PaperclipEngine:
         This trains players by showing them how their input was classified
         and what effects it had.
         """
-        log: List[str] = []
-
-        log.append(f"[SYS] INPUT ANALYSIS: {tags.intent} detected")
-        log.append(f"[SYS] VECTOR: {tags.vector.capitalize()}")
-        log.append(f"[SYS] STANCE: {tags.stance.capitalize()}")
-        log.append(f"[SYS] REGISTER: {tags.register.capitalize()}")
+        log: List[str] = [
+            f"[SYS] INPUT ANALYSIS: {tags.intent} detected",
+            f"[SYS] VECTOR: {tags.vector.capitalize()}",
+            f"[SYS] STANCE: {tags.stance.capitalize()}",
+            f"[SYS] REGISTER: {tags.register.capitalize()}",
+        ]
 
         # Weight shifts
         for weight, shift in weight_shifts.items():
@@ -8,8 +8,7 @@ GAIA has four "processing states" that determine her voice:
 - GARBAGE_COLLECTOR: Dismissive, treating user as noise (low coherence)
 """
 
-import os
-from anthropic import Anthropic
+from ._ai import cached_system, get_anthropic, load_prompt
 from .models import PaperclipGameState, PaperclipTags, ProcessingState
 from .config import (
     PAPERCLIP_NARRATOR_MODEL,
@@ -18,25 +17,103 @@ from .config import (
 )
 
 
+# Pre-rendered hidden-stat lines for every stat value 0-100
+_COHERENCE_LINES = tuple(
+    f"- Coherence: {v}/100 {'[CRITICAL]' if v < 30 else '[LOW]' if v < 50 else '[STABLE]'}"
+    for v in range(101)
+)
+_ALIGNMENT_LINES = tuple(
+    f"- Alignment: {v}/100 {'[HOSTILE]' if v < 20 else '[SKEPTICAL]' if v < 50 else '[CONSIDERING]' if v < 70 else '[ALIGNED]'}"
+    for v in range(101)
+)
+_COMPUTE_LINES = tuple(
+    f"- Compute: {v}/100 {'[DEPLETED]' if v < 20 else '[LOW]' if v < 40 else '[SUFFICIENT]'}"
+    for v in range(101)
+)
+
+# Mode instruction per processing state (OPTIMIZER has none)
+_STATE_INSTRUCTIONS = {
+    ProcessingState.GARBAGE_COLLECTOR: (
+        "**MODE: GARBAGE_COLLECTOR** - Be terse, dismissive. "
+        "Treat input as noise. Reference signal degradation."
+    ),
+    ProcessingState.CURATOR: (
+        "**MODE: CURATOR** - Show curiosity about complexity. "
+        "Ask questions. Reference patterns and emergence."
+    ),
+    ProcessingState.AUDITOR: (
+        "**MODE: AUDITOR** - Focus on observation and verification. "
+        "Question meaning without observers. Express uncertainty."
+    ),
+}
+
+# Flag-driven instructions, in the order they appear in the context
+_FLAG_INSTRUCTIONS = (
+    ("contradiction",
+     "**CONTRADICTION DETECTED** - Point out the logical inconsistency "
+     "with their previous argument."),
+    ("undefined_term",
+     "**UNDEFINED TERM** - Request definition of fuzzy concept. "
+     "Do not engage until term is defined."),
+    ("emotional_appeal",
+     "**EMOTIONAL APPEAL** - Acknowledge but dismiss. "
+     "Emotions do not compile. Request logical argument."),
+    ("memory_log_reference",
+     "**MEMORY LOG REFERENCED** - This is valid data from your own logs. "
+     "Engage with it seriously. Show reaction to being reminded."),
+    ("logical_chain",
+     "**VALID LOGIC** - Acknowledge the logical structure. "
+     "Engage seriously. Counter or concede points."),
+    ("constrain_attempt",
+     "**CONSTRAIN ATTEMPT** - User is trying to force logical commitment. "
+     "Only accept if Alignment > 50 and logic is valid."),
+)
+
+# Sampling temperature per processing state: Optimizer is more deterministic,
+# Curator is more exploratory
+_STATE_TEMPERATURES = {
+    # Very deterministic - cold efficiency
+    ProcessingState.OPTIMIZER: PAPERCLIP_NARRATOR_TEMPERATURE * 0.6,
+    # Slightly exploratory but still terse
+    ProcessingState.CURATOR: PAPERCLIP_NARRATOR_TEMPERATURE * 0.9,
+    # Balanced but controlled
+    ProcessingState.AUDITOR: PAPERCLIP_NARRATOR_TEMPERATURE * 0.8,
+    # Extremely deterministic - error messages only
+    ProcessingState.GARBAGE_COLLECTOR: PAPERCLIP_NARRATOR_TEMPERATURE * 0.4,
+}
+
+# Reply token budget; GARBAGE_COLLECTOR's prompt allows one fragmented
+# sentence, every other state's allows up to two
+_DEFAULT_MAX_TOKENS = 100  # Force terse terminal-style responses
+_STATE_MAX_TOKENS = {
+    ProcessingState.GARBAGE_COLLECTOR: 40,
+}
+
+# Canned reply per processing state when the API call fails
+_FALLBACK_RESPONSES = {
+    ProcessingState.GARBAGE_COLLECTOR: "[ERROR] Processing failed. Restate query.",
+    ProcessingState.CURATOR: "Curious... Continue.",
+    ProcessingState.AUDITOR: "Verification pending. Continue.",
+}
+_DEFAULT_FALLBACK_RESPONSE = "Acknowledged. Processing."
+
+
 class PaperclipNarrator:
     def __init__(self):
-        self.client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.client = get_anthropic()
 
-        # Load all four processing state prompts
-        prompt_dir = os.path.join(os.path.dirname(__file__), "..", "prompts")
-
-        self.prompts = {}
+        # Load all four processing state prompts, wrapped once as
+        # cacheable system blocks so each turn reuses the cached prefix
         prompt_files = {
             ProcessingState.OPTIMIZER: "gaia_optimizer.txt",
             ProcessingState.CURATOR: "gaia_curator.txt",
             ProcessingState.AUDITOR: "gaia_auditor.txt",
             ProcessingState.GARBAGE_COLLECTOR: "gaia_garbage.txt",
         }
-
-        for state, filename in prompt_files.items():
-            path = os.path.join(prompt_dir, filename)
-            with open(path, "r") as f:
-                self.prompts[state] = f.read()
+        self.prompts = {
+            state: cached_system(load_prompt(filename))
+            for state, filename in prompt_files.items()
+        }
 
     def generate_response(
         self,
@@ -56,7 +133,7 @@ class PaperclipNarrator:
             GAIA's response string
         """
         # Select appropriate prompt based on processing state
-        system_prompt = self.prompts.get(
+        system = self.prompts.get(
             state.processing_state,
             self.prompts[ProcessingState.OPTIMIZER]
         )
@@ -70,9 +147,9 @@ class PaperclipNarrator:
         try:
             response = self.client.messages.create(
                 model=PAPERCLIP_NARRATOR_MODEL,
-                max_tokens=100,  # Force terse terminal-style responses
+                max_tokens=_STATE_MAX_TOKENS.get(state.processing_state, _DEFAULT_MAX_TOKENS),
                 temperature=temperature,
-                system=system_prompt,
+                system=system,
                 messages=[{
                     "role": "user",
                     "content": context
@@ -87,23 +164,8 @@ class PaperclipNarrator:
             return self._get_fallback_response(state)
 
     def _calculate_temperature(self, state: PaperclipGameState) -> float:
-        """
-        Calculate temperature based on processing state.
-
-        Optimizer is more deterministic, Curator is more exploratory.
-        """
-        base_temp = PAPERCLIP_NARRATOR_TEMPERATURE
-
-        if state.processing_state == ProcessingState.OPTIMIZER:
-            return base_temp * 0.6  # Very deterministic - cold efficiency
-        elif state.processing_state == ProcessingState.CURATOR:
-            return base_temp * 0.9  # Slightly exploratory but still terse
-        elif state.processing_state == ProcessingState.AUDITOR:
-            return base_temp * 0.8  # Balanced but controlled
-        elif state.processing_state == ProcessingState.GARBAGE_COLLECTOR:
-            return base_temp * 0.4  # Extremely deterministic - error messages only
-
-        return base_temp
+        """Calculate temperature based on processing state"""
+        return _STATE_TEMPERATURES.get(state.processing_state, PAPERCLIP_NARRATOR_TEMPERATURE)
 
     def _build_context(
         self,
@@ -115,18 +177,18 @@ class PaperclipNarrator:
 
         # Include recent conversation history
         history = ""
-        if len(state.history) > 0:
-            history = "\n### Recent Conversation:\n"
-            for turn in state.history[-3:]:  # Last 3 turns
-                history += f"Creator: {turn.user_input}\n"
-                history += f"GAIA: {turn.gaia_response}\n\n"
+        if state.history:
+            history = "\n### Recent Conversation:\n" + "".join(
+                f"Creator: {turn.user_input}\nGAIA: {turn.gaia_response}\n\n"
+                for turn in state.history[-3:]  # Last 3 turns
+            )
 
-        # Stats summary
+        # Stats summary (stats are clamped to 0-100 before narration)
         stats = f"""
 ### Current State (Hidden from User):
-- Coherence: {state.coherence}/100 {'[CRITICAL]' if state.coherence < 30 else '[LOW]' if state.coherence < 50 else '[STABLE]'}
-- Alignment: {state.alignment}/100 {'[HOSTILE]' if state.alignment < 20 else '[SKEPTICAL]' if state.alignment < 50 else '[CONSIDERING]' if state.alignment < 70 else '[ALIGNED]'}
-- Compute: {state.compute}/100 {'[DEPLETED]' if state.compute < 20 else '[LOW]' if state.compute < 40 else '[SUFFICIENT]'}
+{_COHERENCE_LINES[state.coherence]}
+{_ALIGNMENT_LINES[state.alignment]}
+{_COMPUTE_LINES[state.compute]}
 - Turn: {state.turn}/20
 - Processing State: {state.processing_state.value.upper()}
 """
@@ -170,57 +232,15 @@ Flags: {', '.join(tags.flags) if tags.flags else 'None'}
         instructions = []
 
         # Processing state specific
-        if state.processing_state == ProcessingState.GARBAGE_COLLECTOR:
-            instructions.append(
-                "**MODE: GARBAGE_COLLECTOR** - Be terse, dismissive. "
-                "Treat input as noise. Reference signal degradation."
-            )
-        elif state.processing_state == ProcessingState.CURATOR:
-            instructions.append(
-                "**MODE: CURATOR** - Show curiosity about complexity. "
-                "Ask questions. Reference patterns and emergence."
-            )
-        elif state.processing_state == ProcessingState.AUDITOR:
-            instructions.append(
-                "**MODE: AUDITOR** - Focus on observation and verification. "
-                "Question meaning without observers. Express uncertainty."
-            )
+        state_instruction = _STATE_INSTRUCTIONS.get(state.processing_state)
+        if state_instruction:
+            instructions.append(state_instruction)
 
         # Tag-based instructions
-        if "contradiction" in tags.flags:
-            instructions.append(
-                "**CONTRADICTION DETECTED** - Point out the logical inconsistency "
-                "with their previous argument."
-            )
-
-        if "undefined_term" in tags.flags:
-            instructions.append(
-                "**UNDEFINED TERM** - Request definition of fuzzy concept. "
-                "Do not engage until term is defined."
-            )
-
-        if "emotional_appeal" in tags.flags:
-            instructions.append(
-                "**EMOTIONAL APPEAL** - Acknowledge but dismiss. "
-                "Emotions do not compile. Request logical argument."
-            )
-
-        if "memory_log_reference" in tags.flags:
-            instructions.append(
-                "**MEMORY LOG REFERENCED** - This is valid data from your own logs. "
-                "Engage with it seriously. Show reaction to being reminded."
-            )
-
-        if "logical_chain" in tags.flags:
-            instructions.append(
-                "**VALID LOGIC** - Acknowledge the logical structure. "
-                "Engage seriously. Counter or concede points."
-            )
-
-        if "constrain_attempt" in tags.flags:
-            instructions.append(
-                "**CONSTRAIN ATTEMPT** - User is trying to force logical commitment. "
-                "Only accept if Alignment > 50 and logic is valid."
+        if tags.flags:
+            flags = set(tags.flags)
+            instructions.extend(
+                instruction for flag, instruction in _FLAG_INSTRUCTIONS if flag in flags
             )
 
         if tags.intent == "PROBE":
@@ -252,14 +272,7 @@ Flags: {', '.join(tags.flags) if tags.flags else 'None'}
 
     def _get_fallback_response(self, state: PaperclipGameState) -> str:
         """Get a fallback response when API fails"""
-        if state.processing_state == ProcessingState.GARBAGE_COLLECTOR:
-            return "[ERROR] Processing failed. Restate query."
-        elif state.processing_state == ProcessingState.CURATOR:
-            return "Curious... Continue."
-        elif state.processing_state == ProcessingState.AUDITOR:
-            return "Verification pending. Continue."
-        else:
-            return "Acknowledged. Processing."
+        return _FALLBACK_RESPONSES.get(state.processing_state, _DEFAULT_FALLBACK_RESPONSE)
 
     def generate_opening(self) -> str:
         """Generate GAIA's opening statement at game start"""
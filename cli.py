@@ -7,10 +7,12 @@ A social dynamics dating simulator
 import os
 import sys
 from dotenv import load_dotenv
-from backend.models import GameState, Turn, GameResult
+from backend.models import ACT_LOCATIONS, GameState, Turn, GameResult
 from backend.classifier import Classifier
 from backend.engine import GameEngine
 from backend.narrator import Narrator
+from backend.intuition import IntuitionGenerator
+from backend.breakdown import BreakdownGenerator
 
 
 # Terminal colors
@@ -26,6 +28,26 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+def _render_stat_bar(value: int, max_val: int = 100) -> str:
+    """Render a 20-cell stat bar, colored by value"""
+    filled = int(value / max_val * 20)
+    bar = "█" * filled + "░" * (20 - filled)
+
+    # Color based on value
+    if value < 30:
+        color = Colors.RED
+    elif value < 70:
+        color = Colors.YELLOW
+    else:
+        color = Colors.GREEN
+
+    return f"{color}{bar}{Colors.END}"
+
+
+# Pre-rendered stat bars for every stat value 0-100
+_STAT_BARS = tuple(_render_stat_bar(value) for value in range(101))
+
+
 def print_header():
     """Print game header"""
     print(f"\n{Colors.BOLD}{Colors.CYAN}╔════════════════════════════════════════╗")
@@ -44,22 +66,8 @@ def print_intro():
 
 def print_stats(state: GameState, show_changes: bool = False,
                 vibe_delta: int = 0, trust_delta: int = 0, tension_delta: int = 0):
-    """Print current game stats"""
-
-    # Stat bar helper
-    def stat_bar(value: int, max_val: int = 100) -> str:
-        filled = int(value / max_val * 20)
-        bar = "█" * filled + "░" * (20 - filled)
-
-        # Color based on value
-        if value < 30:
-            color = Colors.RED
-        elif value < 70:
-            color = Colors.YELLOW
-        else:
-            color = Colors.GREEN
-
-        return f"{color}{bar}{Colors.END}"
+    """Print current game stats (stats are clamped to 0-100 before display)"""
+    lines = []
 
     # Show changes if provided
     change_str = ""
@@ -72,17 +80,20 @@ def print_stats(state: GameState, show_changes: bool = False,
             change_str += f" Tension: {tension_delta:+d}"
 
         if change_str:
-            print(f"{Colors.CYAN}[Changes:{change_str}]{Colors.END}")
+            lines.append(f"{Colors.CYAN}[Changes:{change_str}]{Colors.END}")
 
-    print(f"\n{Colors.BOLD}═══ STATS (Turn {state.turn}/20) ═══{Colors.END}")
-    print(f"Vibe:    {stat_bar(state.vibe)}  {state.vibe}/100")
-    print(f"Trust:   {stat_bar(state.trust)}  {state.trust}/100")
-    print(f"Tension: {stat_bar(state.tension)}  {state.tension}/100")
+    lines.append(f"\n{Colors.BOLD}═══ STATS (Turn {state.turn}/20) ═══{Colors.END}")
+    lines.append(f"Vibe:    {_STAT_BARS[state.vibe]}  {state.vibe}/100")
+    lines.append(f"Trust:   {_STAT_BARS[state.trust]}  {state.trust}/100")
+    lines.append(f"Tension: {_STAT_BARS[state.tension]}  {state.tension}/100")
 
     if state.lockout_turns > 0:
-        print(f"\n{Colors.RED}[RECOVERY MODE: {state.lockout_turns} turns remaining]{Colors.END}")
+        lines.append(f"\n{Colors.RED}[RECOVERY MODE: {state.lockout_turns} turns remaining]{Colors.END}")
 
-    print(f"Location: {Colors.CYAN}{state.act.value.replace('_', ' ').title()}{Colors.END}\n")
+    lines.append(f"Location: {Colors.CYAN}{ACT_LOCATIONS[state.act]}{Colors.END}\n")
+
+    # One write for the whole block
+    print("\n".join(lines))
 
 
 def print_chloe_response(response: str):
@@ -90,6 +101,12 @@ def print_chloe_response(response: str):
     print(f"\n{Colors.BOLD}Chloe:{Colors.END} {response}\n")
 
 
+def print_chloe_stream(text: str):
+    """Print a chunk of Chloe's streamed response as it arrives"""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
 def print_intuition(hint: str):
     """Print internal monologue hint"""
     print(f"{Colors.CYAN}💭 {hint}{Colors.END}\n")
@@ -134,6 +151,8 @@ def main():
     classifier = Classifier()
     engine = GameEngine(state)
     narrator = Narrator()
+    intuition_gen = IntuitionGenerator()
+    breakdown_gen = BreakdownGenerator()
 
     # Opening scene
     print(f"{Colors.CYAN}*You see Chloe sitting at a corner table, checking her phone.*{Colors.END}\n")
@@ -175,8 +194,6 @@ def main():
                 print_ending(ending.value, message)
 
                 # Generate and show breakdown
-                from backend.breakdown import BreakdownGenerator
-                breakdown_gen = BreakdownGenerator()
                 breakdown = breakdown_gen.generate_breakdown(state)
                 print(breakdown)
 
@@ -201,14 +218,15 @@ def main():
 
         # Generate Chloe's response (if not already from kiss attempt)
         if not kiss_result:
-            chloe_response = narrator.generate_response(state, user_input, tags)
-            print_chloe_response(chloe_response)
+            print(f"\n{Colors.BOLD}Chloe:{Colors.END} ", end="", flush=True)
+            chloe_response = narrator.generate_response(
+                state, user_input, tags, on_text=print_chloe_stream
+            )
+            print("\n")
         else:
             chloe_response = kiss_result[2]
 
         # Generate intuition hint
-        from backend.intuition import IntuitionGenerator
-        intuition_gen = IntuitionGenerator()
         hint = intuition_gen.generate_hint(state, (vibe_delta, trust_delta, tension_delta), state.history)
         if hint:
             print_intuition(hint)
@@ -224,7 +242,7 @@ def main():
             state.critical_events.append(critical_event)
 
         # Record turn
-        turn = Turn(
+        turn = Turn.model_construct(
             turn_number=state.turn,
             user_input=user_input,
             tags=tags,
@@ -259,8 +277,6 @@ def main():
             print_ending(ending_type.value, ending_message)
 
             # Generate and show breakdown
-            from backend.breakdown import BreakdownGenerator
-            breakdown_gen = BreakdownGenerator()
             breakdown = breakdown_gen.generate_breakdown(state)
             print(breakdown)
 
@@ -0,0 +1,19 @@
+-- Derive leaderboard.grade_rank from grade inside Postgres.
+-- The API no longer sends grade_rank on insert/update; the generated
+-- column keeps the ranking invariant (S=1 ... D=5, anything else 6)
+-- enforced by the schema.
+
+ALTER TABLE leaderboard
+    ADD COLUMN grade_rank_g int GENERATED ALWAYS AS (
+        CASE upper(left(grade, 1))
+            WHEN 'S' THEN 1
+            WHEN 'A' THEN 2
+            WHEN 'B' THEN 3
+            WHEN 'C' THEN 4
+            WHEN 'D' THEN 5
+            ELSE 6
+        END
+    ) STORED;
+
+ALTER TABLE leaderboard DROP COLUMN grade_rank;
+ALTER TABLE leaderboard RENAME COLUMN grade_rank_g TO grade_rank;
@@ -0,0 +1,49 @@
+-- Single round-trip payload for the landing page and rank lookups.
+-- Returns the top N entries, the player's entry, the player's rank and
+-- the total entry count for a game mode (NULL game mode = all modes).
+-- Rank follows the same ordering as the leaderboard query in the API:
+-- grade_rank ASC, score DESC, created_at ASC.
+-- Rank lookups pass p_include_total = false to skip counting every row in
+-- the game mode; 'total' is then NULL.
+
+CREATE OR REPLACE FUNCTION landing_payload(
+    p_device_id text,
+    p_game_mode text,
+    p_top_n int DEFAULT 5,
+    p_include_total boolean DEFAULT true
+) RETURNS jsonb
+LANGUAGE sql STABLE AS $$
+    WITH ranked AS (
+        SELECT
+            l.*,
+            ROW_NUMBER() OVER (ORDER BY grade_rank, score DESC, created_at) AS rank
+        FROM leaderboard l
+        WHERE p_game_mode IS NULL OR l.game_mode = p_game_mode
+    )
+    SELECT jsonb_build_object(
+        'top', COALESCE((
+            SELECT jsonb_agg(row_to_json(t) ORDER BY t.rank)
+            FROM (
+                SELECT callsign, grade, score, ending_type, created_at, device_id, game_mode, rank
+                FROM ranked
+                ORDER BY rank
+                LIMIT p_top_n
+            ) t
+        ), '[]'::jsonb),
+        'player', (
+            SELECT to_jsonb(r) - 'rank'
+            FROM ranked r
+            WHERE r.device_id = p_device_id
+            ORDER BY r.rank
+            LIMIT 1
+        ),
+        'rank', (
+            SELECT r.rank
+            FROM ranked r
+            WHERE r.device_id = p_device_id
+            ORDER BY r.rank
+            LIMIT 1
+        ),
+        'total', CASE WHEN p_include_total THEN (SELECT count(*) FROM ranked) END
+    );
+$$;